@@ -19,23 +19,57 @@ Module Dependencies:
 - `django.contrib.admin`: For admin site customizations.
 - `django.urls`: For defining URL paths for custom views.
 - `django.shortcuts.render`: For rendering HTML templates.
-- `django.utils.html.format_html`: For safely formatting HTML in Django templates.
+- `django.http.JsonResponse`: For serving the statistics data as JSON.
+- `django.utils.safestring.mark_safe`: For marking constant HTML as safe.
 - `django.utils.timezone`: For timezone-related operations.
-- `django.db.models.Count`: For counting related objects.
+- `django.core.cache.cache`: For caching the statistics page data.
+- `django.db.connection`: For reading PostgreSQL row count estimates.
+- `django.db.models.Count`, `F`, `Q`: For conditional aggregation and renaming annotations.
 - `datetime.timedelta`: For handling date intervals.
 - `.models`: For importing the `Profile`, `Category`, `Ad`, and `Comment` models.
+- `.constants`: For the statistics cache key and timeout.
 
 """
 from django.contrib import admin
 from django.urls import path
 from django.shortcuts import render
-from django.utils.html import format_html
+from django.http import JsonResponse
+from django.utils.safestring import mark_safe
 from django.utils import timezone
-from django.db.models import Count
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, F, Q
 from datetime import timedelta
 
+from .constants import STATISTICS_CACHE_KEY, STATISTICS_CACHE_TIMEOUT
 from .models import Profile, Category, Ad, Comment
 
+ESTIMATED_COUNT_THRESHOLD = 10000
+
+
+def get_estimated_count(model) -> int:
+    """
+    Returns the number of rows in the model's table.
+
+    On PostgreSQL the planner estimate from `pg_class.reltuples` is used
+    for big tables, which avoids a full `COUNT(*)` scan. Small tables,
+    tables that were never analyzed and other databases get an exact count.
+
+    Args:
+        model: The model class whose rows are counted.
+
+    Returns:
+        int: The estimated or exact number of rows.
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                           [model._meta.db_table])
+            row = cursor.fetchone()
+        if row and row[0] >= ESTIMATED_COUNT_THRESHOLD:
+            return row[0]
+    return model.objects.count()
+
 
 class CustomAdminSite(admin.AdminSite):
     """
@@ -45,6 +79,7 @@ class CustomAdminSite(admin.AdminSite):
         site_header (str): The header for the admin panel.
         site_title (str): The title of the admin panel.
         index_title (str): The title of the admin index page.
+        _cached_urls (Optional[list]): The URL list built by `get_urls`.
 
     Methods:
         get_urls:
@@ -60,7 +95,22 @@ class CustomAdminSite(admin.AdminSite):
                 request (HttpRequest): The HTTP request object.
 
             Returns:
-                HttpResponse: The rendered statistics page with context data.
+                HttpResponse: The rendered statistics page.
+
+        statistics_data_view:
+            Args:
+                self (CustomAdminSite): The instance of the CustomAdminSite class.
+                request (HttpRequest): The HTTP request object.
+
+            Returns:
+                JsonResponse: The statistics data.
+
+        get_statistics:
+            Args:
+                self (CustomAdminSite): The instance of the CustomAdminSite class.
+
+            Returns:
+                dict: Statistics about ads, comments, and categories.
 
         index:
             Args:
@@ -74,51 +124,90 @@ class CustomAdminSite(admin.AdminSite):
     site_header = "Адмін-панель Дошки оголошень"
     site_title = "Дошка оголошень"
     index_title = "Ласкаво просимо до адміністративної панелі"
+    _cached_urls = None
 
     def get_urls(self):
         """
         Overrides the default URLs to add a custom statistics page.
 
+        The URL list is built on the first call and reused afterwards.
+
         Args:
             self (CustomAdminSite): The instance of the CustomAdminSite class.
 
         Returns:
             list: List of custom URLs, including the statistics page.
         """
-        urls = super().get_urls()
-        custom_urls = [
-            path('statistics/', self.admin_view(self.statistics_view), name="statistics"),
-        ]
-        return custom_urls + urls
+        if self._cached_urls is None:
+            urls = [
+                path('statistics/', self.admin_view(self.statistics_view), name="statistics"),
+                path('statistics/data/', self.admin_view(self.statistics_data_view),
+                     name="statistics_data"),
+            ]
+            urls.extend(super().get_urls())
+            self._cached_urls = urls
+        return self._cached_urls
 
     def statistics_view(self, request):
         """
-        Displays statistics about ads, comments, and categories.
+        Displays the statistics page.
+
+        The page is rendered without querying the database; the statistics
+        themselves are loaded by the page from `statistics_data_view`.
+
+        Args:
+            self (CustomAdminSite): The instance of the CustomAdminSite class.
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponse: The rendered statistics page.
+        """
+        return render(request, 'admin/statistics.html', self.each_context(request))
+
+    def statistics_data_view(self, request):
+        """
+        Returns statistics about ads, comments, and categories as JSON.
+
+        The statistics are cached for `STATISTICS_CACHE_TIMEOUT` seconds and
+        invalidated by the signal handlers when ads, comments or categories change.
 
         Args:
             self (CustomAdminSite): The instance of the CustomAdminSite class.
             request (HttpRequest): The HTTP request object.
 
         Returns:
-            HttpResponse: The rendered statistics page with context data.
+            JsonResponse: The statistics data.
+        """
+        data = cache.get_or_set(STATISTICS_CACHE_KEY, self.get_statistics,
+                                STATISTICS_CACHE_TIMEOUT)
+        return JsonResponse(data)
+
+    def get_statistics(self):
+        """
+        Collects statistics about ads, comments, and categories.
+
+        Args:
+            self (CustomAdminSite): The instance of the CustomAdminSite class.
+
+        Returns:
+            dict: The statistics context for the statistics page.
         """
         last_month = timezone.now() - timedelta(days=30)
-        ads_last_month = Ad.objects.filter(created_at__gte=last_month).count()
-        active_ads = Ad.objects.filter(is_active=True).count()
-        inactive_ads = Ad.objects.filter(is_active=False).count()
-        comments_count = Comment.objects.count()
-        category_stats = Category.objects.annotate(num_ads=Count('ad')).values('name', 'num_ads')
-
-        context = {
-            'ads_last_month': ads_last_month,
-            'active_ads': active_ads,
-            'inactive_ads': inactive_ads,
-            'category_stats': category_stats,
+        ad_stats = Ad.objects.aggregate(
+            ads_last_month=Count('pk', filter=Q(created_at__gte=last_month)),
+            active_ads=Count('pk', filter=Q(is_active=True)),
+            inactive_ads=Count('pk', filter=Q(is_active=False)),
+        )
+        comments_count = get_estimated_count(Comment)
+        category_stats = Category.objects.with_active_counts().values(
+            'name', num_ads=F('_active_ads_count'))
+
+        return {
+            **ad_stats,
+            'category_stats': list(category_stats),
             'comments_count': comments_count,
         }
 
-        return render(request, 'admin/statistics.html', context)
-
     def index(self, request, extra_context=None):
         """
         Adds a custom link to the statistics page on the admin dashboard.
@@ -147,6 +236,7 @@ class ProfileAdmin(admin.ModelAdmin):
     Attributes:
         list_display (tuple): The fields to display in the list view.
         search_fields (tuple): The fields to enable searching for.
+        list_select_related (tuple): The related fields to join in the changelist query.
 
     Methods:
         None
@@ -157,7 +247,8 @@ class ProfileAdmin(admin.ModelAdmin):
         form.base_fields['email'].required = False
         return form
     list_display = ('user', 'bio', 'birth_date', 'phone_number', 'location', 'email', 'is_active', 'is_staff')
-    search_fields = ('user', 'email', 'phone_number', 'bio', 'location')
+    search_fields = ('user__username', 'user__email', 'email', 'phone_number', 'bio', 'location')
+    list_select_related = ('user',)
 
 
 @admin.register(Category, site=admin_site)
@@ -170,11 +261,30 @@ class CategoryAdmin(admin.ModelAdmin):
         search_fields (tuple): The fields to enable searching for.
 
     Methods:
-        None
+        get_queryset:
+            Args:
+                self (CategoryAdmin): The instance of the CategoryAdmin class.
+                request (HttpRequest): The HTTP request object.
+
+            Returns:
+                QuerySet: Categories annotated with the count of active ads.
     """
     list_display = ('name', 'description', 'get_active_ads_count')
     search_fields = ('name', 'description')
 
+    def get_queryset(self, request):
+        """
+        Annotates categories with the count of active ads in a single query.
+
+        Args:
+            self (CategoryAdmin): The instance of the CategoryAdmin class.
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            QuerySet: Categories annotated with `_active_ads_count`.
+        """
+        return super().get_queryset(request).with_active_counts()
+
 
 @admin.register(Ad, site=admin_site)
 class AdAdmin(admin.ModelAdmin):
@@ -186,6 +296,9 @@ class AdAdmin(admin.ModelAdmin):
         list_filter (tuple): The fields to filter by.
         search_fields (tuple): The fields to enable searching for.
         date_hierarchy (str): The field to enable date-based navigation.
+        list_select_related (tuple): The related fields to join in the changelist query.
+        raw_id_fields (tuple): The foreign keys edited by ID instead of a select box.
+        _STATS_BUTTON (SafeString): HTML for the statistics button, built once.
 
     Methods:
         view_statistics:
@@ -197,9 +310,12 @@ class AdAdmin(admin.ModelAdmin):
                 str: HTML for the statistics button.
     """
     list_display = ('title', 'price', 'created_at', 'updated_at', 'is_active', 'user', 'category', 'view_statistics')
-    list_filter = ('is_active', 'category', 'user')
+    list_filter = ('is_active', 'category', ('user', admin.RelatedOnlyFieldListFilter))
     search_fields = ('title', 'description', 'price')
     date_hierarchy = 'created_at'
+    list_select_related = ('user', 'category')
+    raw_id_fields = ('user',)
+    _STATS_BUTTON = mark_safe('<a href="/admin/statistics/" class="button">📊 Переглянути статистику</a>')
 
     def view_statistics(self, obj):
         """
@@ -212,7 +328,7 @@ class AdAdmin(admin.ModelAdmin):
         Returns:
             str: HTML for the statistics button.
         """
-        return format_html('<a href="/admin/statistics/" class="button">📊 Переглянути статистику</a>')
+        return self._STATS_BUTTON
 
     view_statistics.short_description = "Статистика"
 
@@ -226,19 +342,16 @@ class CommentAdmin(admin.ModelAdmin):
         list_display (tuple): The fields to display in the list view.
         search_fields (tuple): The fields to enable searching for.
         list_filter (tuple): The fields to filter by.
+        list_select_related (tuple): The related fields to join in the changelist query.
+        raw_id_fields (tuple): The foreign keys edited by ID instead of a select box.
 
     Methods:
         None
     """
     list_display = ('user', 'content', 'ad', 'created_at')
+    list_select_related = ('user', 'ad')
     search_fields = ('content', 'user__username', 'ad__title')
-    list_filter = ('ad', 'user')
-
-
-admin_site = CustomAdminSite(name='custom_admin')
+    list_filter = (('ad', admin.RelatedOnlyFieldListFilter),
+                   ('user', admin.RelatedOnlyFieldListFilter))
+    raw_id_fields = ('user', 'ad')
 
-# Register models with custom admin site
-admin_site.register(Profile, ProfileAdmin)
-admin_site.register(Category, CategoryAdmin)
-admin_site.register(Ad, AdAdmin)
-admin_site.register(Comment, CommentAdmin)
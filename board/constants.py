@@ -0,0 +1,23 @@
+"""
+Module 'board.constants'
+
+This module holds constants shared between the modules of the 'board' application.
+
+Constants:
+    - STATISTICS_CACHE_KEY (str): Cache key for the admin statistics page data.
+    - STATISTICS_CACHE_TIMEOUT (int): Lifetime of the cached statistics, in seconds.
+    - AVATAR_URL_SESSION_KEY (str): Session key of the cached user avatar URL.
+    - CATEGORY_CHOICES_CACHE_KEY (str): Cache key for the category choices of `AdForm`.
+    - CATEGORY_CHOICES_CACHE_TIMEOUT (int): Lifetime of the cached category choices, in seconds.
+    - AVATAR_MAX_SIZE (int): Maximum avatar size accepted by the profile form, in bytes.
+    - UPLOAD_REQUEST_MAX_SIZE (int): Maximum size of a multipart request body, in bytes.
+      Covers the 3 MB limit of the avatar model validator plus form overhead.
+"""
+
+STATISTICS_CACHE_KEY = 'board_admin_statistics'
+STATISTICS_CACHE_TIMEOUT = 300
+AVATAR_URL_SESSION_KEY = 'avatar_url'
+CATEGORY_CHOICES_CACHE_KEY = 'board_ad_category_choices'
+CATEGORY_CHOICES_CACHE_TIMEOUT = 3600
+AVATAR_MAX_SIZE = 2 << 20
+UPLOAD_REQUEST_MAX_SIZE = (3 << 20) + (256 << 10)
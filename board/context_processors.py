@@ -4,26 +4,33 @@ to the context for all templates in a Django application.
 
 The function checks if the user is authenticated, retrieves the avatar URL
 from the user's profile if available, or defaults to a generic avatar image URL
-if the user does not have an avatar or is not authenticated.
+if the user does not have an avatar or is not authenticated. The resolved URL
+is kept in the user's session, so the profile is only queried on a cache miss.
 
 Modules:
     - django.conf.settings: Provides access to project settings.
     - django.http.HttpRequest: The request object that contains the user information.
+    - board.models.Profile: The profile model holding the avatar.
+    - board.models.DEFAULT_AVATAR: The path of the shared default avatar.
+    - board.constants.AVATAR_URL_SESSION_KEY: The session key of the cached avatar URL.
 
 Function:
     - avatar_processor(request: HttpRequest) -> Dict[str, str]: Adds the avatar URL
       to the context for templates.
 """
-import os
 from typing import Dict
 
+from django.conf import settings
 from django.http import HttpRequest
 
-from my_site import settings
 from logger_config import get_logger
+from .constants import AVATAR_URL_SESSION_KEY
+from .models import Profile, DEFAULT_AVATAR
 
 logger = get_logger(__name__, "context_processors.log")
 
+DEFAULT_AVATAR_URL = f"{settings.MEDIA_URL}{DEFAULT_AVATAR}"
+
 
 def avatar_processor(request: HttpRequest) -> Dict[str, str]:
     """
@@ -32,6 +39,8 @@ def avatar_processor(request: HttpRequest) -> Dict[str, str]:
     If the user is authenticated, it retrieves the avatar URL from the user's profile.
     If the profile does not have an avatar, a default avatar URL is used.
     If the user is not authenticated, the default avatar URL is used.
+    The URL resolved for an authenticated user is stored in the session and reused
+    until it is dropped on login or profile update.
 
     Args:
         request (HttpRequest): The HTTP request object, which contains the user.
@@ -40,21 +49,17 @@ def avatar_processor(request: HttpRequest) -> Dict[str, str]:
         Dict[str, str]: A dictionary containing the avatar URL, which can be used
                         in templates.
     """
-
-    default_avatar_url = os.path.join('board', 'default_avatar.png')
-
-    avatar_url = f"{settings.MEDIA_URL}{default_avatar_url}"
+    avatar_url = DEFAULT_AVATAR_URL
     if request.user.is_authenticated:
-        try:
-            profile = request.user.profile
-            if profile and profile.avatar:
-                avatar_url = profile.avatar.url
-                logger.info("User avatar URL: %s", avatar_url)
-            else:
-                logger.warning("User has no avatar or profile, using default.")
-        except AttributeError:
-            logger.warning("User has no profile, using default avatar.")
-        except Exception as e:
-            logger.error("Error getting avatar: %s", str(e))
+        cached_avatar_url = request.session.get(AVATAR_URL_SESSION_KEY)
+        if cached_avatar_url:
+            return {'avatar_url': cached_avatar_url}
+        profile = Profile.objects.only('avatar').filter(user_id=request.user.id).first()
+        if profile is not None and profile.avatar:
+            avatar_url = profile.avatar.url
+            logger.debug("User avatar URL: %s", avatar_url)
+        else:
+            logger.debug("User has no avatar or profile, using default.")
+        request.session[AVATAR_URL_SESSION_KEY] = avatar_url
 
     return {'avatar_url': avatar_url}
@@ -18,9 +18,13 @@ Dependencies:
 - django.forms: For form creation.
 - django.contrib.auth: For user authentication and password management.
 - django.core.exceptions: For custom validation errors.
+- django.core.cache: For caching the category choices.
+- django.db: For atomic writes and unique constraint errors.
 - .models: For data models (Ad, Comment, Profile, Category).
 - .validators: For custom data validation.
+- .constants: For the category choices cache settings and the avatar size limit.
 """
+from typing import Optional
 
 from django import forms
 from django.contrib.auth import password_validation
@@ -28,9 +32,34 @@ from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import PasswordChangeForm as DjangoPasswordChangeForm
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 
-from .models import Ad, Comment, Profile, Category
-from .validators import validate_avatar_image
+from .constants import (CATEGORY_CHOICES_CACHE_KEY, CATEGORY_CHOICES_CACHE_TIMEOUT,
+                        AVATAR_MAX_SIZE)
+from .models import Ad, Comment, Profile, Category, DEFAULT_AVATAR
+from .validators import validate_avatar_image, normalize_phone_number
+
+_PROFILE_FIELD_NAMES = frozenset(field.name for field in Profile._meta.concrete_fields)
+
+
+def _get_category_choices() -> list:
+    """
+    Returns the choices for the existing category field of `AdForm`.
+
+    The choices are kept in the shared `CACHES` backend and invalidated by the
+    signal handlers when a category is saved or deleted, so every worker sees
+    the change. `AdForm.clean` still checks that a chosen category exists.
+
+    Returns:
+        A list of (id, name) tuples preceded by the empty choice.
+    """
+    return cache.get_or_set(
+        CATEGORY_CHOICES_CACHE_KEY,
+        lambda: [('', '---------')] + list(Category.objects.values_list('id', 'name')),
+        CATEGORY_CHOICES_CACHE_TIMEOUT
+    )
 
 
 class AdForm(forms.ModelForm):
@@ -42,7 +71,7 @@ class AdForm(forms.ModelForm):
     description, price, and category.
 
     Attributes:
-        existing_category (ChoiceField): A field to select an existing category.
+        existing_category (TypedChoiceField): A field to select an existing category by id.
         new_category (CharField): A field to create a new category.
 
         Meta:
@@ -52,10 +81,13 @@ class AdForm(forms.ModelForm):
     Methods:
         __init__: Initializes the form and sets the choices for the existing category field.
         clean: Cleans and validates the form data.
-        save: Saves the form data and creates or updates an Ad instance.
+        _find_category_id: Looks up the id of an existing category by name.
+        save: Saves the form data, creating a new category if needed,
+              and creates or updates an Ad instance.
     """
-    existing_category = forms.ChoiceField(label="Вибрати категорію",
-                                          choices=[], required=False)
+    existing_category = forms.TypedChoiceField(label="Вибрати категорію",
+                                               choices=[], required=False,
+                                               coerce=int, empty_value=None)
     new_category = forms.CharField(label="Нова категорія", required=False)
 
     class Meta:
@@ -72,11 +104,7 @@ class AdForm(forms.ModelForm):
         """
         super().__init__(*args, **kwargs)
         if 'instance' not in kwargs or not kwargs['instance']:
-            categories = Category.objects.all()
-            self.fields['existing_category'].choices = (
-                    [('', '---------')] + [(category.id, category.name)
-                                           for category in categories]
-            )
+            self.fields['existing_category'].choices = _get_category_choices()
 
     def clean(self) -> dict:
         """
@@ -88,7 +116,7 @@ class AdForm(forms.ModelForm):
         Raises:
             ValidationError: If neither existing category nor new category is provided,
                            or if both are provided, or if the new category name is empty,
-                           or if the selected existing category does not exist.
+                           or if the chosen category no longer exists.
         """
         cleaned_data = super().clean()
         existing_category = cleaned_data.get('existing_category')
@@ -104,20 +132,45 @@ class AdForm(forms.ModelForm):
             category_name = new_category.strip()
             if not category_name:
                 self.add_error('new_category', "Назва нової категорії не може бути порожньою.")
-            category, created = Category.objects.get_or_create(name=category_name)
-            cleaned_data['category'] = category
+            else:
+                category_id = self._find_category_id(category_name)
+                if category_id:
+                    cleaned_data['category_id'] = category_id
+                else:
+                    self._pending_category_name = category_name
         elif existing_category:
-            try:
-                cleaned_data['category'] = Category.objects.get(id=existing_category)
-            except Category.DoesNotExist:
-                self.add_error('existing_category', "Обрана категорія не існує.")
+            # The choices come from the cache and may still list a deleted category.
+            if Category.objects.filter(pk=existing_category).exists():
+                cleaned_data['category_id'] = existing_category
+            else:
+                cache.delete(CATEGORY_CHOICES_CACHE_KEY)
+                self.add_error('existing_category', "Вибрана категорія більше не існує.")
 
         return cleaned_data
 
+    @staticmethod
+    def _find_category_id(name: str) -> Optional[int]:
+        """
+        Looks up the id of an existing category by name.
+
+        The database is queried rather than the cached category choices,
+        which may still list a deleted category.
+
+        Args:
+            name: The name of the category.
+
+        Returns:
+            The id of the matching category, or None if it does not exist yet.
+        """
+        return Category.objects.filter(name=name).values_list('id', flat=True).first()
+
     def save(self, commit: bool = True) -> Ad:
         """
         Saves the form data and creates or updates an Ad instance.
 
+        A new category entered in the form is created here rather than
+        during validation.
+
         Args:
             commit: Whether to save the instance to the database.
 
@@ -125,8 +178,12 @@ class AdForm(forms.ModelForm):
             The saved Ad instance.
         """
         instance = super().save(commit=False)
-        if hasattr(self, 'cleaned_data') and 'category' in self.cleaned_data:
-            instance.category = self.cleaned_data['category']
+        pending_category_name = getattr(self, '_pending_category_name', None)
+        if pending_category_name:
+            with transaction.atomic():
+                instance.category, _ = Category.objects.get_or_create(name=pending_category_name)
+        elif 'category_id' in self.cleaned_data:
+            instance.category_id = self.cleaned_data['category_id']
         if commit:
             instance.save()
         return instance
@@ -170,6 +227,7 @@ class RegistrationForm(forms.ModelForm):
         avatar (ImageField, optional): Profile avatar.
 
     Methods:
+        clean_phone_number: Normalizes the phone number to the E.164 format.
         clean_username: Ensures username uniqueness.
         clean_email: Ensures email uniqueness.
         clean: Ensures password confirmation.
@@ -231,6 +289,18 @@ class RegistrationForm(forms.ModelForm):
             "avatar",
         ]
 
+    def clean_phone_number(self) -> str:
+        """
+        Validates the phone number and normalizes it to the E.164 format.
+
+        Returns:
+            The normalized phone number.
+
+        Raises:
+            ValidationError: If the phone number is invalid or not in a valid format.
+        """
+        return normalize_phone_number(self.cleaned_data.get("phone_number"))
+
     def clean_username(self) -> str:
         """
         Ensures username uniqueness.
@@ -257,8 +327,8 @@ class RegistrationForm(forms.ModelForm):
             ValidationError: If the email is already in use.
         """
         email = self.cleaned_data.get("email")
-        if (User.objects.filter(email=email).exists()
-                or Profile.objects.filter(email=email).exists()):
+        if (User.objects.filter(email=email).values('pk')
+                .union(Profile.objects.filter(email=email).values('pk')).exists()):
             raise forms.ValidationError("Ця електронна пошта вже використовується.")
         return email
 
@@ -286,27 +356,41 @@ class RegistrationForm(forms.ModelForm):
         Creates a new user and associated profile.
 
         The user password is securely hashed, and a profile is created with
-        the additional fields provided in the form.
+        the additional fields provided in the form. The user and the profile
+        are written in a single transaction, the profile with a single INSERT.
+        Username uniqueness is checked in `clean_username`; the database unique
+        constraint only catches a user registered with the same name in the
+        meantime. Only an integrity error of the user INSERT is reported as
+        a taken username; any other error is raised as is.
 
         Args:
             commit: Whether to save the instance to the database.
 
         Returns:
             The created User instance.
-        """
-        user = User.objects.create_user(
-            username=self.cleaned_data["username"],
-            email=self.cleaned_data["email"],
-            password=self.cleaned_data["password1"]
-        )
-        profile, created = Profile.objects.get_or_create(user=user)
-        profile.phone_number = self.cleaned_data.get("phone_number", "")
-        profile.birth_date = self.cleaned_data.get("birth_date")
-        profile.location = self.cleaned_data.get("location", "")
-        profile.avatar = self.cleaned_data.get("avatar")
 
-        if commit:
-            profile.save()
+        Raises:
+            ValidationError: If a user with the given username was registered
+                             after the form was validated.
+        """
+        with transaction.atomic():
+            try:
+                user = User.objects.create_user(
+                    username=self.cleaned_data["username"],
+                    email=self.cleaned_data["email"],
+                    password=self.cleaned_data["password1"]
+                )
+            except IntegrityError as exc:
+                raise ValidationError("Користувач із таким ім'ям вже існує.") from exc
+            profile = Profile(
+                user=user,
+                phone_number=self.cleaned_data.get("phone_number", ""),
+                birth_date=self.cleaned_data.get("birth_date"),
+                location=self.cleaned_data.get("location", ""),
+                avatar=self.cleaned_data.get("avatar"),
+            )
+            if commit:
+                profile.save(force_insert=True)
         return user
 
 
@@ -328,13 +412,20 @@ class UserProfileForm(forms.ModelForm):
     email = forms.EmailField(required=False)
     remove_avatar = forms.BooleanField(label="Видалити аватар", required=False)
 
-    def __init__(self, *args, **kwargs) -> None:
+    def get_initial_for_field(self, field: forms.Field, field_name: str):
         """
-        Initializes the form and sets the initial email value.
+        Returns the initial value of a field, taking the email from the profile.
+
+        Args:
+            field: The form field.
+            field_name: The name of the form field.
+
+        Returns:
+            The initial value for the field.
         """
-        super().__init__(*args, **kwargs)
-        if self.instance and self.instance.email:
-            self.fields["email"].initial = self.instance.email
+        if field_name == "email" and self.instance.pk is not None and (email := self.instance.email):
+            return email
+        return super().get_initial_for_field(field, field_name)
 
     avatar = forms.ImageField(
         label="Аватар",
@@ -348,6 +439,18 @@ class UserProfileForm(forms.ModelForm):
                                  widget=forms.DateInput(attrs={'type': 'date'}))
     location = forms.CharField(label="Адреса", required=False)
 
+    def clean_phone_number(self) -> str:
+        """
+        Validates the phone number and normalizes it to the E.164 format.
+
+        Returns:
+            The normalized phone number.
+
+        Raises:
+            ValidationError: If the phone number is invalid or not in a valid format.
+        """
+        return normalize_phone_number(self.cleaned_data.get("phone_number"))
+
     def clean_avatar(self) -> forms.ImageField:
         """
         Validate the uploaded avatar size.
@@ -359,8 +462,8 @@ class UserProfileForm(forms.ModelForm):
             forms.ValidationError: If the file size exceeds 2MB.
         """
         avatar = self.cleaned_data.get("avatar")
-        if avatar:
-            if avatar.size > 2 * 1024 * 1024:
+        if isinstance(avatar, UploadedFile):
+            if avatar.size > AVATAR_MAX_SIZE:
                 raise forms.ValidationError("Розмір файлу аватарки не повинен перевищувати 2 МБ.")
         return avatar
 
@@ -382,6 +485,9 @@ class UserProfileForm(forms.ModelForm):
         """
         Saves the form data and updates the Profile instance.
 
+        An existing profile is updated with only the columns that changed;
+        nothing is written if no field changed.
+
         Args:
             commit: Whether to save the instance to the database.
             user: The user associated with the profile.
@@ -390,11 +496,21 @@ class UserProfileForm(forms.ModelForm):
             The saved Profile instance.
         """
         instance = super().save(commit=False)
-        if self.cleaned_data.get('remove_avatar'):
-            instance.avatar.delete(save=False)
+        update_fields = {name for name in self.changed_data
+                         if name in self._meta.fields and name in _PROFILE_FIELD_NAMES}
+        # A new upload already replaced the avatar, so removal only applies without one.
+        if (self.cleaned_data.get('remove_avatar')
+                and not isinstance(self.cleaned_data.get('avatar'), UploadedFile)
+                and instance.avatar):
+            if instance.avatar.name != DEFAULT_AVATAR:
+                instance.avatar.delete(save=False)
             instance.avatar = None
+            update_fields.add('avatar')
         if commit:
-            instance.save()
+            if instance.pk is None:
+                instance.save()
+            elif update_fields:
+                instance.save(update_fields=update_fields)
         return instance
 
 
@@ -409,6 +525,13 @@ class PasswordChangeForm(DjangoPasswordChangeForm):
         old_password (CharField): Field for the current password.
         new_password1 (CharField): Field for the new password.
         new_password2 (CharField): Field for confirming the new password.
+
+    Methods:
+        clean_new_password1: Runs the password validators on the new password.
+        validate_password_for_user: Disables the base form's repeated validator run.
+        clean_old_password: Defers the current password check to `clean`.
+        clean: Ensures the new password differs from the old one and is confirmed,
+               then checks the current password.
     """
     old_password = forms.CharField(
         label='Current Password',
@@ -441,31 +564,44 @@ class PasswordChangeForm(DjangoPasswordChangeForm):
             password_validation.validate_password(password1, self.user)
         return password1
 
+    def validate_password_for_user(self, user, password_field_name: str = "password2") -> None:
+        """
+        Skips the second run of the password validators in the base form's `clean`.
+
+        The validators already ran on `new_password1` in `clean_new_password1`,
+        and `new_password2` is only accepted when it matches it.
+
+        Args:
+            user: The user whose password is being changed.
+            password_field_name: The name of the field the base form would validate.
+        """
+
     def clean_old_password(self) -> str:
         """
-        Validates the old password.
+        Returns the old password without checking it.
 
-        Returns:
-            The validated old password.
+        The check hashes the password, so it is deferred to `clean`
+        and only runs once all cheaper checks have passed.
 
-        Raises:
-            ValidationError: If the old password is incorrect.
+        Returns:
+            The old password.
         """
-        old_password = self.cleaned_data.get('old_password')
-        if not check_password(old_password, self.user.password):
-            raise forms.ValidationError('Невірний поточний пароль.')
-        return old_password
+        return self.cleaned_data.get('old_password')
 
     def clean(self) -> dict:
         """
-        Validates the form data and ensures password match.
+        Validates the form data, ensures password match and checks the old password.
+
+        The old password is checked last, and only when the rest of the form
+        is valid, to avoid hashing it for submissions that fail anyway.
 
         Returns:
             The cleaned form data.
 
         Raises:
             ValidationError: If the new password is the same as the old password,
-                           or if the new passwords do not match.
+                           or if the new passwords do not match,
+                           or if the old password is incorrect.
         """
         cleaned_data = super().clean()
         old_password = cleaned_data.get("old_password")
@@ -478,4 +614,8 @@ class PasswordChangeForm(DjangoPasswordChangeForm):
         if new_password1 and new_password2 and new_password1 != new_password2:
             self.add_error("new_password2", "Паролі не збігаються.")
 
+        if (old_password is not None and not self.errors
+                and not check_password(old_password, self.user.password)):
+            self.add_error("old_password", "Невірний поточний пароль.")
+
         return cleaned_data
@@ -0,0 +1,79 @@
+"""
+Module 'board.middleware'
+
+This module contains middleware for the 'board' application.
+
+Classes:
+    - UploadSizeLimitMiddleware: Rejects multipart requests to the avatar upload views
+      whose declared body size exceeds `UPLOAD_REQUEST_MAX_SIZE` before Django parses
+      and buffers the upload.
+
+Functions:
+    - limit_upload_size: Marks a view whose uploads are checked by the middleware.
+"""
+from typing import Any, Callable, Optional
+
+from django.http import HttpRequest, HttpResponse
+
+from .constants import UPLOAD_REQUEST_MAX_SIZE
+
+
+def limit_upload_size(view_func: Callable) -> Callable:
+    """
+    Marks a view whose multipart uploads are limited by `UploadSizeLimitMiddleware`.
+
+    Other views, such as the admin, the API and the chats, are not affected.
+
+    Args:
+        view_func: The view function to mark.
+
+    Returns:
+        The same view function.
+    """
+    view_func.limit_upload_size = True
+    return view_func
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Middleware that rejects oversized multipart uploads with a 413 response.
+
+    Only views marked with `limit_upload_size` are checked. The check uses
+    the `Content-Length` header only, and runs in `process_view` before
+    `CsrfViewMiddleware` reads the form, so an oversized avatar upload
+    is refused without reading the request body.
+
+    Attributes:
+        get_response (Callable): The next middleware or view in the chain.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        return self.get_response(request)
+
+    def process_view(self, request: HttpRequest, view_func: Callable,
+                     view_args: tuple, view_kwargs: dict[str, Any]) -> Optional[HttpResponse]:
+        """
+        Rejects the request if it is a multipart upload larger than the allowed size.
+
+        Args:
+            request: The incoming HTTP request.
+            view_func: The view that will handle the request.
+            view_args: The positional arguments of the view.
+            view_kwargs: The keyword arguments of the view.
+
+        Returns:
+            A 413 response for oversized uploads to a marked view, otherwise None.
+        """
+        if (not getattr(view_func, 'limit_upload_size', False)
+                or request.content_type != 'multipart/form-data'):
+            return None
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > UPLOAD_REQUEST_MAX_SIZE:
+            return HttpResponse("Розмір завантаження завеликий.", status=413)
+        return None
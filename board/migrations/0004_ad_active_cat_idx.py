@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15 02:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0003_alter_profile_avatar_alter_profile_phone_number'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ad',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category'], name='ad_active_cat_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15 02:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0005_ad_created_at_idx_ad_is_active_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['ad', 'created_at'], name='comment_ad_created_idx'),
+        ),
+    ]
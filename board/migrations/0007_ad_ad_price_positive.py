@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15 02:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0006_comment_comment_ad_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='ad',
+            constraint=models.CheckConstraint(condition=models.Q(('price__gt', 0)), name='ad_price_positive', violation_error_message='Ціна має бути додатним числом.'),
+        ),
+    ]
@@ -3,17 +3,16 @@ Module 'board.models'
 
 This module defines the models for the 'board' application in Django, which include:
 - Profile: Represents the user profile with additional user information.
-- Category: Represents an advertisement category.
+- Category: Represents an advertisement category, with its `CategoryQuerySet`.
 - Ad: Represents an advertisement with details such as title, description, price, and category.
 - Comment: Represents a comment on an advertisement.
 
 Module Dependencies:
 - `django.contrib.auth.models.User`: The User model used to associate users with profiles and ads.
 - `django.db.models`: Used to define models and fields for the database.
+- `django.db.transaction`: Used to run bulk imports in a single transaction.
 - `django.utils.timezone`: Provides timezone utilities, including the current time.
 - `datetime.timedelta`: Used to handle date calculations for ad expiration.
-- `django.core.exceptions.ValidationError`: Used for custom model validation.
-- `os`: Used for file path operations.
 - `uuid`: Used for generating unique filenames.
 - `.validators.validate_phone_number`: Custom validator for phone numbers.
 - `.validators.validate_avatar_image`: Custom validator for avatar images.
@@ -29,22 +28,25 @@ Models:
 Each model provides various methods for managing the data, including string representations,
 validation methods, and helper functions.
 """
-import os
 import uuid
 from datetime import timedelta
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
-from django.core.exceptions import ValidationError
 
 from .validators import validate_phone_number, validate_avatar_image
 
+DEFAULT_AVATAR = 'board/default_avatar.png'
+AD_LIFETIME = timedelta(days=30)
+
 
 def get_avatar_upload_path(instance: "Profile", filename: str) -> str:
     """
     Generates the path for saving user avatars inside the respective app's folder.
 
+    The file gets a random name; its extension is kept in lower case.
+
     Args:
         instance: The model instance containing the image field.
         filename: The name of the uploaded file.
@@ -52,9 +54,8 @@ def get_avatar_upload_path(instance: "Profile", filename: str) -> str:
     Returns:
         The file path where the avatar will be stored.
     """
-    ext = filename.split('.')[-1]
-    unique_filename = f"{uuid.uuid4()}.{ext}"
-    return os.path.join('board', 'avatars', str(instance.user.id), unique_filename)
+    ext = filename.rpartition('.')[2].lower()
+    return f"board/avatars/{instance.user_id}/{uuid.uuid4().hex}.{ext}"
 
 
 def get_default_avatar() -> str:
@@ -64,7 +65,7 @@ def get_default_avatar() -> str:
     Returns:
         The default avatar path.
     """
-    return os.path.join('board', 'default_avatar.png')
+    return DEFAULT_AVATAR
 
 
 class Profile(models.Model):
@@ -116,6 +117,30 @@ class Profile(models.Model):
         return f'{self.user.username} Profile'
 
 
+class CategoryQuerySet(models.QuerySet):
+    """
+    A QuerySet for the `Category` model.
+
+    Methods:
+        with_active_counts:
+            Annotates the categories with their count of active ads.
+    """
+
+    def with_active_counts(self) -> "CategoryQuerySet":
+        """
+        Annotates the categories with the count of active ads.
+
+        The counts of all categories are computed in a single query and
+        stored in `_active_ads_count`, which `Category.get_active_ads_count` reuses.
+
+        Returns:
+            CategoryQuerySet: The annotated categories.
+        """
+        return self.annotate(
+            _active_ads_count=models.Count('ad', filter=models.Q(ad__is_active=True))
+        )
+
+
 class Category(models.Model):
     """
     A model representing a category for advertisements.
@@ -126,6 +151,7 @@ class Category(models.Model):
     Attributes:
         name (CharField): The name of the category (must be unique).
         description (TextField): A description of the category.
+        objects (Manager): The manager built from `CategoryQuerySet`.
 
     Methods:
         get_active_ads_count:
@@ -137,15 +163,24 @@ class Category(models.Model):
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField()
 
+    objects = CategoryQuerySet.as_manager()
+
     def get_active_ads_count(self) -> int:
         """
         Gets the count of active ads in this category.
 
+        Uses the `_active_ads_count` annotation when the category was fetched
+        with it, otherwise queries the database.
+
         Returns:
             int: The count of active ads in the category.
         """
+        if hasattr(self, '_active_ads_count'):
+            return self._active_ads_count
         return self.ad_set.filter(is_active=True).count()
 
+    get_active_ads_count.admin_order_field = '_active_ads_count'
+
     def __str__(self) -> str:
         """
         String representation of the Category model.
@@ -162,7 +197,8 @@ class Ad(models.Model):
 
     This model contains information about the ad such as title, description,
     price, creation date, and category, and provides methods for description
-    truncation, deactivating expired ads, and validating the price.
+    truncation and deactivating expired ads. A positive price is enforced
+    by the `ad_price_positive` database check constraint.
 
     Attributes:
         title (CharField): The title of the ad.
@@ -181,8 +217,11 @@ class Ad(models.Model):
         deactivate_if_expired:
             Deactivates the ad if it has been created more than 30 days ago.
 
-        clean:
-            Validates the price of the ad to ensure it is greater than zero.
+        deactivate_expired:
+            Deactivates all ads created more than 30 days ago in batched UPDATE queries.
+
+        bulk_import:
+            Inserts many ads in batched INSERT queries inside one transaction.
 
         __str__:
             Returns a string representation of the ad's title.
@@ -196,6 +235,19 @@ class Ad(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
 
+    class Meta:
+        #Metaclass for Ad
+        indexes = [
+            models.Index(fields=['category'], condition=models.Q(is_active=True),
+                         name='ad_active_cat_idx'),
+            models.Index(fields=['created_at'], name='ad_created_at_idx'),
+            models.Index(fields=['is_active'], name='ad_is_active_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(price__gt=0), name='ad_price_positive',
+                                   violation_error_message="Ціна має бути додатним числом."),
+        ]
+
     def short_description(self) -> str:
         """
         Returns the first 100 characters of the ad's description.
@@ -210,21 +262,58 @@ class Ad(models.Model):
         Deactivates the ad if it has been created more than 30 days ago.
 
         This method checks if the ad's creation date is older than 30 days
-        and sets the ad's `is_active` status to False if it is.
+        and sets the ad's `is_active` status to False if it is. The row is
+        updated with a single query that does not call `save()`, so it is
+        safe to use from `post_save` handlers.
         """
-        if self.created_at + timedelta(days=30) < timezone.now():
+        if self.is_active and self.created_at < timezone.now() - AD_LIFETIME:
+            type(self).objects.filter(pk=self.pk, is_active=True).update(is_active=False)
             self.is_active = False
-            self.save()
 
-    def clean(self) -> None:
+    @classmethod
+    def deactivate_expired(cls, batch_size: int = 10000) -> int:
+        """
+        Deactivates all active ads created more than 30 days ago.
+
+        The ads are updated with set-based UPDATE queries of at most
+        `batch_size` rows each, so no row is loaded into Python and
+        large tables are not locked by a single long statement.
+        Signals are not sent for the updated ads.
+
+        Args:
+            batch_size: The maximum number of ads updated by one query.
+
+        Returns:
+            int: The number of deactivated ads.
         """
-        Validates the price to ensure it is a positive value.
+        expired = cls.objects.filter(is_active=True,
+                                     created_at__lt=timezone.now() - AD_LIFETIME)
+        total = 0
+        while True:
+            ids = list(expired.order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return total
+            total += cls.objects.filter(pk__in=ids).update(is_active=False)
+
+    @classmethod
+    def bulk_import(cls, ads: list["Ad"], batch_size: int = 10000) -> list["Ad"]:
+        """
+        Inserts many ads at once, for imports and data migrations.
+
+        The ads are written with multi-row INSERT queries of at most
+        `batch_size` rows inside a single transaction. `save()`, `clean()`
+        and the `post_save` handlers (such as the new ad email) are not
+        run for the imported ads.
 
-        Raises:
-            ValidationError: If the price is less than or equal to zero.
+        Args:
+            ads: The unsaved ads to insert.
+            batch_size: The maximum number of ads inserted by one query.
+
+        Returns:
+            list: The inserted ads.
         """
-        if self.price <= 0:
-            raise ValidationError("Ціна має бути додатним числом.")
+        with transaction.atomic():
+            return cls.objects.bulk_create(ads, batch_size=batch_size)
 
     def __str__(self) -> str:
         """
@@ -258,6 +347,12 @@ class Comment(models.Model):
     ad = models.ForeignKey(Ad, related_name='comments', on_delete=models.CASCADE)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
 
+    class Meta:
+        #Metaclass for Comment
+        indexes = [
+            models.Index(fields=['ad', 'created_at'], name='comment_ad_created_idx'),
+        ]
+
     def __str__(self) -> str:
         """
         String representation of the Comment model.
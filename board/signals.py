@@ -11,29 +11,44 @@ Module Dependencies:
 - `django.db.models.signals.post_delete`: Provides the post-delete signal.
 - `django.db.models.signals.pre_delete`: Provides the pre-delete signal.
 - `django.dispatch.receiver`: A decorator for signal handlers.
-- `django.core.mail.send_mail`: Used to send email notifications.
+- `django.contrib.auth.signals.user_logged_in`: Provides the user login signal.
+- `django.db.transaction`: Used to queue emails and file deletions after the commit.
+- `django.core.cache.cache`: Used to invalidate the cached admin statistics.
 - `django.contrib.auth.models.User`: The `User` model for the `Profile` creation.
-- `.models.Profile, Ad`: The `Profile` and `Ad` models used in the signal handlers.
-- os: Used for file operations.
+- `.models.Profile, Ad, Comment, Category`: The models used in the signal handlers.
+- `.models.DEFAULT_AVATAR`: The path of the shared default avatar.
+- `.constants.STATISTICS_CACHE_KEY`: The cache key of the admin statistics.
+- `.constants.AVATAR_URL_SESSION_KEY`: The session key of the cached avatar URL.
+- `.constants.CATEGORY_CHOICES_CACHE_KEY`: The cache key of the category choices.
+- `celery_tasks.tasks.send_ad_created_email`: The task that sends the new ad email.
 
 Signal Handlers:
     - create_user_profile: Creates a new `Profile` instance when a new `User` is created.
     - save_user_profile: Saves the `Profile` instance
       when the associated `User` instance is saved.
-    - send_email_on_ad_create: Sends an email notification to the user
+    - send_email_on_ad_create: Queues an email notification to the user
       when a new `Ad` is created.
     - deactivate_if_expired: Deactivates an `Ad` if it has been created
       for more than 30 days.
     - delete_avatar: Automatically deletes the avatar file when a `Profile` is deleted.
     - delete_user_profile: Automatically deletes the associated `User`
       when a `Profile` is deleted.
+    - invalidate_statistics_cache: Drops the cached admin statistics when an `Ad`,
+      `Comment` or `Category` is saved or deleted.
+    - reset_avatar_url: Drops the avatar URL cached in the session when a user logs in.
+    - invalidate_category_choices_cache: Drops the cached `AdForm` category choices
+      when a `Category` is saved or deleted.
 """
-import os
 from django.db.models.signals import post_save, post_delete, pre_delete
 from django.dispatch import receiver
-from django.core.mail import send_mail
+from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
+from django.core.cache import cache
 from django.contrib.auth.models import User
-from .models import Profile, Ad
+from .constants import (STATISTICS_CACHE_KEY, AVATAR_URL_SESSION_KEY,
+                        CATEGORY_CHOICES_CACHE_KEY)
+from .models import Profile, Ad, Comment, Category, DEFAULT_AVATAR
+from celery_tasks.tasks import send_ad_created_email
 
 
 @receiver(post_save, sender=User)
@@ -83,8 +98,11 @@ def send_email_on_ad_create(sender, instance, created, **kwargs):
     Signal handler that sends an email when a new `Ad` instance is created.
 
     This signal is triggered after a new `Ad` instance is created.
-    It sends an email notification
+    It queues an email notification
     to the user who created the ad, informing them of their new ad.
+    The email is sent by a Celery task once the transaction is committed,
+    so the request does not wait for the mail server. Only the email
+    column is loaded when the ad's user is not already cached.
 
     Args:
         sender: The model class that triggered the signal (`Ad`).
@@ -94,13 +112,12 @@ def send_email_on_ad_create(sender, instance, created, **kwargs):
         **kwargs: Additional keyword arguments.
     """
     if created:
-        send_mail(
-            'Нове оголошення',
-            f'Ви створили нове оголошення: {instance.title}',
-            'burkalo@gmail.com',
-            [instance.user.email],
-            fail_silently=False,
-        )
+        if Ad.user.is_cached(instance):
+            email = instance.user.email
+        else:
+            email = User.objects.filter(pk=instance.user_id).values_list('email', flat=True).first()
+        title = instance.title
+        transaction.on_commit(lambda: send_ad_created_email.delay(title, email))
 
 
 @receiver(post_save, sender=Ad)
@@ -117,6 +134,8 @@ def deactivate_if_expired(sender, instance, **kwargs):
         instance: The instance of the `Ad` model that was saved.
         **kwargs: Additional keyword arguments.
     """
+    if kwargs.get('raw'):
+        return
     instance.deactivate_if_expired()
 
 
@@ -125,14 +144,17 @@ def delete_avatar(sender, instance, **kwargs):
     """
     Signal handler that automatically deletes the avatar file when a `Profile` is deleted.
 
+    The file is removed through the storage API once the transaction is
+    committed. The shared default avatar is never deleted.
+
     Args:
         sender: The model class that triggered the signal (`Profile`).
         instance: The instance of the `Profile` model that is about to be deleted.
         **kwargs: Additional keyword arguments.
     """
-    if instance.avatar:
-        if os.path.isfile(instance.avatar.path):
-            os.remove(instance.avatar.path)
+    if instance.avatar and instance.avatar.name != DEFAULT_AVATAR:
+        storage, name = instance.avatar.storage, instance.avatar.name
+        transaction.on_commit(lambda: storage.delete(name))
 
 
 @receiver(post_delete, sender=Profile)
@@ -141,10 +163,59 @@ def delete_user_profile(sender, instance, **kwargs):
     Signal handler that automatically deletes the associated `User`
     when a `Profile` is deleted.
 
+    Nothing is done when the profile was removed by the cascade of a `User`
+    deletion, since that user is already being deleted.
+
     Args:
         sender: The model class that triggered the signal (`Profile`).
         instance: The instance of the `Profile` model that was deleted.
         **kwargs: Additional keyword arguments.
     """
-    if instance.user:
-        instance.user.delete()
+    origin = kwargs.get('origin')
+    if isinstance(origin, User) or getattr(origin, 'model', None) is User:
+        return
+    User.objects.filter(pk=instance.user_id).delete()
+
+
+@receiver([post_save, post_delete], sender=Ad)
+@receiver([post_save, post_delete], sender=Comment)
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_statistics_cache(sender, **kwargs):
+    """
+    Signal handler that drops the cached admin statistics
+    when an `Ad`, `Comment` or `Category` is saved or deleted.
+
+    Args:
+        sender: The model class that triggered the signal.
+        **kwargs: Additional keyword arguments.
+    """
+    cache.delete(STATISTICS_CACHE_KEY)
+
+
+@receiver(user_logged_in)
+def reset_avatar_url(sender, request, user, **kwargs):
+    """
+    Signal handler that drops the avatar URL cached in the session
+    when a user logs in, so it is resolved again for the new user.
+
+    Args:
+        sender: The class of the user that logged in.
+        request: The current HTTP request.
+        user: The user instance that logged in.
+        **kwargs: Additional keyword arguments.
+    """
+    if request is not None and hasattr(request, 'session'):
+        request.session.pop(AVATAR_URL_SESSION_KEY, None)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_choices_cache(sender, **kwargs):
+    """
+    Signal handler that drops the cached `AdForm` category choices
+    when a `Category` is saved or deleted.
+
+    Args:
+        sender: The model class that triggered the signal (`Category`).
+        **kwargs: Additional keyword arguments.
+    """
+    cache.delete(CATEGORY_CHOICES_CACHE_KEY)
@@ -11,30 +11,57 @@ Test Cases:
        including price validation.
     3. `CommentModelTest`: Tests the functionality of the `Comment` model
        and its association with `Ad` objects.
-    4. `ProfileModelTest`: Ensures that user profiles are created
+    4. `ProfileModelTest`: Ensures that user profiles are created on registration
        and associated with users correctly.
     5. `AdSignalsTest`: Tests the signals related to the `Ad` model,
        including email notifications and ad deactivation.
-    6. `UserProfileFormTest`: Tests for the validation, submission,
+    6. `AdFormTest`: Tests the category and price validation of the `AdForm`.
+    7. `UserProfileFormTest`: Tests for the validation, submission,
        and file upload functionality of the `UserProfileForm`.
-    7. `EditProfileViewTest`: Tests the behavior of the `edit_profile` view,
+    8. `EditProfileViewTest`: Tests the behavior of the `edit_profile` view,
     including GET and POST requests for editing a user profile.
+    9. `AdStatisticsViewTest`: Tests the ad and category counts shown
+       by the `ad_statistics` view.
+    10. `RegistrationViewTest`: Tests that the `register` view reports
+        a taken username on the username field.
+    11. `UploadSizeLimitMiddlewareTest`: Tests that oversized uploads to the marked
+        views are refused and other requests are passed through.
+    12. `AdminStatisticsDataTest`: Tests the cached admin statistics endpoint
+        and its invalidation.
+    13. `AvatarProcessorTest`: Tests the avatar URL cached in the session
+        by the `avatar_processor` context processor.
+    14. `PasswordChangeFormTest`: Tests that the current password is checked
+        only after the new password checks pass.
+    15. `ProfileDeleteSignalsTest`: Tests that deleting a profile deletes its user
+        and that deleting a user does not delete it twice.
 
 Each test case follows the standard Django `TestCase` pattern to test specific aspects
 of the models, views, and forms. They verify that data is correctly handled,
 validations are applied, and proper responses are returned for various interactions.
+All test cases use `TestCase`, which rolls each test back inside a transaction.
+Tests that need many ads create them with `make_ads`, which inserts them
+with a single `bulk_create` query instead of one `save()` per ad.
+Code that runs after a commit, such as the queued new ad email, is tested with
+`captureOnCommitCallbacks` instead of the much slower `TransactionTestCase`.
 
 Modules and Dependencies:
     - `django.test.TestCase`: The base class for all test cases in Django,
        providing methods for sending requests, asserting responses,
        and managing test setup/teardown.
+    - `django.test.override_settings`: Used to switch the profile tests
+       to in-memory file storage. The fast password hasher is set
+       in `my_site.settings_test`.
     - `django.urls.reverse`: Used to generate URLs for views based
        on their names and parameters.
     - `django.core.files.uploadedfile.SimpleUploadedFile`: Used to simulate file uploads
        in the tests.
-    - `PIL.Image`: Used for generating images in the avatar upload test.
+    - `django.core.files.base.ContentFile`, `django.core.files.storage.default_storage`:
+       Used to store an existing avatar and check that it is deleted.
     - `django.db.models.signals.post_save`: Used for connecting and disconnecting
     signals related to model changes.
+    - `contextlib.contextmanager`: Used to mute the profile signals
+       around test setup.
+    - `unittest.mock`: Used to run the new ad email task in-process.
 
 Each class includes setup and teardown methods to ensure that tests run
 in an isolated environment and do not interfere with each other.
@@ -45,19 +72,90 @@ Test cases are self-contained and are intended to verify that the individual com
 of the application work independently and together as expected.
 """
 
+from contextlib import contextmanager
+from types import MappingProxyType
+from unittest import mock
+from typing import Iterator
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.models.signals import post_save
 from .signals import create_user_profile, save_user_profile
 from django.shortcuts import reverse
-from django.test import TestCase
-from PIL import Image
-import io
+from django.http import HttpRequest, HttpResponse
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
 
-from .forms import UserProfileForm
+from .forms import AdForm, PasswordChangeForm, RegistrationForm, UserProfileForm
+from .constants import (AVATAR_URL_SESSION_KEY, CATEGORY_CHOICES_CACHE_KEY,
+                        STATISTICS_CACHE_KEY, UPLOAD_REQUEST_MAX_SIZE)
+from .middleware import UploadSizeLimitMiddleware, limit_upload_size
+from .validators import validate_avatar_image
 from .models import Category, Ad, Comment, Profile
 from django.core import mail
+from django.core.cache import cache
+from celery_tasks.tasks import send_ad_created_email
+from django.utils import timezone
+from datetime import timedelta
+
+IN_MEMORY_STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+PROFILE_FORM_DATA = MappingProxyType({
+    "phone_number": "+380961231122",
+    "email": "test@email.com",
+    "location": "New Address"
+})
+# A valid 1x1 PNG image, so the avatar test does not have to encode one.
+AVATAR_IMAGE = (b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01'
+                b'\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\xdac\xf8\xcf\xc0'
+                b'\x00\x00\x03\x01\x01\x00\xf7\x03AC\x00\x00\x00\x00IEND\xaeB`\x82')
+
+
+@contextmanager
+def mute_profile_signals() -> Iterator[None]:
+    """
+    Disconnects the `User` profile signal handlers for the duration of the block.
+
+    The handlers are reconnected even if the block raises, so a failing
+    setup cannot leave them disconnected for the following tests.
+
+    Yields:
+        None
+    """
+    post_save.disconnect(create_user_profile, sender=User)
+    post_save.disconnect(save_user_profile, sender=User)
+    try:
+        yield
+    finally:
+        post_save.connect(create_user_profile, sender=User)
+        post_save.connect(save_user_profile, sender=User)
+
+
+def make_ads(count: int, user: User, category: Category, **fields) -> list[Ad]:
+    """
+    Creates `count` test ads with a single multi-row INSERT.
+
+    The ads are inserted with `Ad.bulk_import`, so the `post_save`
+    handlers are not run for them.
+
+    Args:
+        count: The number of ads to create.
+        user: The author of the ads.
+        category: The category of the ads.
+        **fields: Extra field values shared by all the ads.
+
+    Returns:
+        list: The created ads.
+    """
+    return Ad.bulk_import([Ad(title=f"Оголошення {i}", description="Тестове", price=100,
+                              user=user, category=category, **fields)
+                           for i in range(count)])
 
 
 class CategoryModelTest(TestCase):
@@ -114,21 +212,25 @@ class AdModelTest(TestCase):
         test_price_validator:
             Tests that an ad's price cannot be negative, raising
             a `ValidationError`.
+
+        test_deactivate_expired:
+            Tests that only ads older than 30 days are deactivated in bulk.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
         Set up the necessary data for the `Ad` model tests.
 
-        This method creates a user and a category instance
-        for the subsequent tests.
+        This method creates a user and a category instance once
+        for all tests of the class.
 
         Returns:
             None
         """
-        self.user = User.objects.create_user(username="testuser",
-                                             password="password")
-        self.category = Category.objects.create(name="Нерухомість")
+        cls.user = User.objects.create_user(username="ad_testuser",
+                                            password="password")
+        cls.category = Category.objects.create(name="Нерухомість")
 
     def test_create_ad(self) -> None:
         """
@@ -149,14 +251,15 @@ class AdModelTest(TestCase):
         )
         self.assertEqual(ad.title, "Продам квартиру")
         self.assertEqual(ad.price, 100000)
-        self.assertEqual(ad.user.username, "testuser")
+        self.assertEqual(ad.user.username, "ad_testuser")
 
     def test_price_validator(self) -> None:
         """
         Tests the price validation in the `Ad` model.
 
         Ensures that an `Ad` with a negative price raises
-        a `ValidationError`.
+        a `ValidationError` from the `ad_price_positive` constraint,
+        without running the other field validators.
 
         Returns:
             None
@@ -164,12 +267,27 @@ class AdModelTest(TestCase):
         ad = Ad(
             title="Недійсне оголошення",
             description="Тестове",
-            price=-500,
-            category=self.category,
-            user=self.user
+            price=-500
         )
         with self.assertRaises(ValidationError):
-            ad.full_clean()
+            ad.validate_constraints()
+
+    def test_deactivate_expired(self) -> None:
+        """
+        Tests the bulk deactivation of expired ads.
+
+        Ensures that `Ad.deactivate_expired` deactivates the ads created
+        more than 30 days ago and keeps the recent ones active.
+
+        Returns:
+            None
+        """
+        ads = make_ads(3, self.user, self.category)
+        Ad.objects.filter(pk__in=[ads[0].pk, ads[1].pk]).update(
+            created_at=timezone.now() - timedelta(days=31))
+
+        self.assertEqual(Ad.deactivate_expired(batch_size=1), 2)
+        self.assertEqual(list(Ad.objects.filter(is_active=True)), [ads[2]])
 
 
 class CommentModelTest(TestCase):
@@ -189,25 +307,26 @@ class CommentModelTest(TestCase):
             Tests that a comment can be created and associated with an ad.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
         Set up the necessary data for the `Comment` model tests.
 
-        This method creates a user, a category, and an ad instance
-        for the subsequent tests.
+        This method creates a user, a category, and an ad instance once
+        for all tests of the class.
 
         Returns:
             None
         """
-        self.user = User.objects.create_user(username="testuser2",
-                                             password="password")
-        self.category = Category.objects.create(name="Авто")
-        self.ad = Ad.objects.create(
+        cls.user = User.objects.create_user(username="comment_testuser",
+                                            password="password")
+        cls.category = Category.objects.create(name="Авто")
+        cls.ad = Ad.objects.create(
             title="Продам авто",
             description="В гарному стані",
             price=5000,
-            category=self.category,
-            user=self.user
+            category=cls.category,
+            user=cls.user
         )
 
     def test_create_comment(self) -> None:
@@ -232,7 +351,7 @@ class CommentModelTest(TestCase):
             content="Цікавий варіант!"
         )
         self.assertEqual(comment.content, "Цікавий варіант!")
-        self.assertEqual(comment.user.username, "testuser2")
+        self.assertEqual(comment.user.username, "comment_testuser")
 
 
 class ProfileModelTest(TestCase):
@@ -246,27 +365,32 @@ class ProfileModelTest(TestCase):
 
     Methods:
         test_create_profile:
-            Tests that a user profile is created when a user is created
+            Tests that a profile is created when a user registers
             and is correctly associated with the user.
     """
 
     def test_create_profile(self) -> None:
         """
-        Tests the automatic creation of a `Profile` instance when a user is created.
+        Tests the creation of a `Profile` instance when a user registers.
 
-        Ensures that the profile is correctly associated with the user.
+        The `create_user_profile` signal handler is disabled, so profiles
+        are created by `RegistrationForm.save` together with the user.
 
         This method performs the following actions:
-            - Creates a new user instance.
+            - Registers a new user through the `RegistrationForm`.
             - Retrieves the associated `Profile` instance.
             - Asserts that the profile is correctly linked to the user.
 
         Returns:
             None
         """
-        user = User.objects.create_user(username="profileuser",
-                                        password="password")
-        profile = Profile.objects.get(user=user)
+        form = RegistrationForm(data={"username": "profileuser",
+                                      "email": "profile@email.com",
+                                      "password1": "password123",
+                                      "password2": "password123"})
+        self.assertTrue(form.is_valid(), f"Form is invalid. Errors: {form.errors}")
+        user = form.save()
+        profile = Profile.objects.select_related('user').get(user=user)
         self.assertEqual(profile.user.username, "profileuser")
 
 
@@ -282,7 +406,7 @@ class AdSignalsTest(TestCase):
         category (Category): A test category to associate with the ad.
 
     Methods:
-        send_email_on_ad_create:
+        test_send_email_on_ad_create:
             Tests that an email is sent when an ad is created, and the email subject
             contains a notification.
 
@@ -290,42 +414,49 @@ class AdSignalsTest(TestCase):
             Tests that deactivating an ad updates its status correctly.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
         Set up the necessary data for testing signals related to the `Ad` model.
 
-        This method creates a user and a category instance for the subsequent tests.
+        This method creates a user and a category instance once for all tests of the class.
 
         Returns:
             None
         """
-        self.user = User.objects.create_user(username="signaluser",
-                                             password="password")
-        self.category = Category.objects.create(name="Техніка")
+        cls.user = User.objects.create_user(username="signal_testuser",
+                                            email="signal@email.com",
+                                            password="password")
+        cls.category = Category.objects.create(name="Техніка")
 
-    def send_email_on_ad_create(self) -> None:
+    def test_send_email_on_ad_create(self) -> None:
         """
         Tests that an email is sent when an ad is created.
 
         Ensures that the email subject contains a notification about ad creation.
 
         This method performs the following actions:
-            - Creates a new `Ad` instance.
-            - Asserts that an email is sent and its subject contains
-            the phrase "Ваше оголошення створено".
+            - Creates a new `Ad` instance and runs the on-commit callbacks,
+              executing the queued Celery task in-process.
+            - Asserts that an email is sent to the ad's author and its subject
+              contains the phrase "Нове оголошення".
 
         Returns:
             None
         """
-        Ad.objects.create(
-            title="Продам ноутбук",
-            description="Майже новий",
-            price=20000,
-            category=self.category,
-            user=self.user
-        )
+        with mock.patch.object(send_ad_created_email, "delay",
+                               side_effect=send_ad_created_email), \
+                self.captureOnCommitCallbacks(execute=True):
+            Ad.objects.create(
+                title="Продам ноутбук",
+                description="Майже новий",
+                price=20000,
+                category=self.category,
+                user=self.user
+            )
         self.assertEqual(len(mail.outbox), 1)
-        self.assertIn("Ваше оголошення створено", mail.outbox[0].subject)
+        self.assertIn("Нове оголошення", mail.outbox[0].subject)
+        self.assertEqual(mail.outbox[0].to, ["signal@email.com"])
 
     def test_ad_deactivation_signal(self) -> None:
         """
@@ -352,9 +483,74 @@ class AdSignalsTest(TestCase):
         )
         ad.is_active = False
         ad.save()
-        self.assertFalse(Ad.objects.get(id=ad.id).is_active)
+        self.assertFalse(Ad.objects.values_list('is_active', flat=True).get(id=ad.id))
 
 
+class AdFormTest(TestCase):
+    """
+    Test case for testing the `AdForm`.
+
+    Methods:
+        test_stale_category_rejected:
+            Tests that a category that is still in the cached choices
+            but no longer exists is rejected.
+
+        test_non_positive_price:
+            Tests that a zero or negative price is rejected with the message
+            of the `ad_price_positive` constraint.
+    """
+
+    def setUp(self) -> None:
+        """
+        Drop the cached category choices before and after each test.
+
+        Returns:
+            None
+        """
+        cache.delete(CATEGORY_CHOICES_CACHE_KEY)
+        self.addCleanup(cache.delete, CATEGORY_CHOICES_CACHE_KEY)
+
+    def test_stale_category_rejected(self) -> None:
+        """
+        Test that a deleted category left in the cached choices is rejected.
+
+        The stale choices are written to the cache directly, as another
+        process would still hold them after the category is deleted.
+
+        Returns:
+            None
+        """
+        category = Category.objects.create(name="Зникла")
+        category_id = category.id
+        category.delete()
+        cache.set(CATEGORY_CHOICES_CACHE_KEY, [('', '---------'), (category_id, "Зникла")])
+
+        form = AdForm(data={"title": "Продам велосипед", "description": "Б/у",
+                            "price": 1500, "existing_category": category_id})
+        self.assertFalse(form.is_valid())
+        self.assertIn("existing_category", form.errors)
+        self.assertIsNone(cache.get(CATEGORY_CHOICES_CACHE_KEY))
+
+    def test_non_positive_price(self) -> None:
+        """
+        Test that the form rejects a price that is not positive.
+
+        The price is checked by the `ad_price_positive` model constraint,
+        so its message is shown as a form error.
+
+        Returns:
+            None
+        """
+        category = Category.objects.create(name="Спорт")
+        for price in (0, -500):
+            with self.subTest(price=price):
+                form = AdForm(data={"title": "Продам м'яч", "description": "Новий",
+                                    "price": price, "existing_category": category.id})
+                self.assertFalse(form.is_valid())
+                self.assertIn("Ціна має бути додатним числом.", form.non_field_errors())
+
+
+@override_settings(STORAGES=IN_MEMORY_STORAGES)
 class UserProfileFormTest(TestCase):
     """
     Test case for testing the `UserProfileForm`.
@@ -373,44 +569,42 @@ class UserProfileFormTest(TestCase):
         test_invalid_phone_number:
             Tests that an invalid phone number fails validation.
 
-        test_upload_avatar:
-            Tests that an image file can be uploaded as an avatar.
-    """
+        test_phone_number_normalized:
+            Tests that a formatted phone number is saved in the E.164 format.
 
-    def setUp(self) -> None:
-        """
-        Set up a test user and profile.
+        test_dotted_phone_number_normalized:
+            Tests that a phone number separated with dots is accepted.
 
-        This method disconnects the signals for profile creation
-        and saving during setup to prevent them from interfering with the test.
-        It creates a user and a profile for use in the test cases.
+        test_upload_avatar:
+            Tests that an image file can be uploaded as an avatar.
 
-        Returns:
-            None
-        """
-        post_save.disconnect(create_user_profile, sender=User)
-        post_save.disconnect(save_user_profile, sender=User)
+        test_remove_avatar:
+            Tests that an existing avatar is cleared and its file deleted.
 
-        self.user = User.objects.create_user(username="testuser",
-                                             password="password123")
-        self.profile = Profile.objects.create(user=self.user,
-                                              phone_number="+380961231122",
-                                              location="Test Address",
-                                              email="test@email.com")
+        test_stored_avatar_not_revalidated:
+            Tests that a stored avatar skips the avatar validator
+            while a new upload is still validated.
+    """
 
-    def tearDown(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
-        Restore the signals after the test.
+        Set up a test user and profile.
 
-        This method reconnects the signals for profile creation
-        and saving to ensure normal operation
-        after the tests are completed.
+        The signals for profile creation and saving are muted during setup
+        to prevent them from interfering with the test.
+        It creates a user and a profile once for all tests of the class.
 
         Returns:
             None
         """
-        post_save.connect(create_user_profile, sender=User)
-        post_save.connect(save_user_profile, sender=User)
+        with mute_profile_signals():
+            cls.user = User.objects.create_user(username="form_testuser",
+                                                password="password123")
+            cls.profile = Profile.objects.create(user=cls.user,
+                                                 phone_number="+380961231122",
+                                                 location="Test Address",
+                                                 email="test@email.com")
 
     def test_valid_form(self) -> None:
         """
@@ -422,12 +616,7 @@ class UserProfileFormTest(TestCase):
         Returns:
             None
         """
-        form_data = {
-            "phone_number": "+380961231122",
-            "email": "test@email.com",
-            "location": "New Address"
-        }
-        form = UserProfileForm(data=form_data, instance=self.profile)
+        form = UserProfileForm(data=PROFILE_FORM_DATA, instance=self.profile)
         self.assertTrue(form.is_valid())
 
     def test_invalid_phone_number(self) -> None:
@@ -440,16 +629,38 @@ class UserProfileFormTest(TestCase):
         Returns:
             None
         """
-        form_data = {
-            "phone_number": "invalid_phone",
-            "email": "test@email.com",
-            "location": "Some Address"
-        }
-        form = UserProfileForm(data=form_data, instance=self.profile)
+        form = UserProfileForm(data={**PROFILE_FORM_DATA, "phone_number": "invalid_phone"},
+                               instance=self.profile)
         self.assertFalse(form.is_valid())
         self.assertIn('phone_number', form.errors)
         self.assertTrue(form.errors['phone_number'])
 
+    def test_phone_number_normalized(self) -> None:
+        """
+        Test that a phone number with spaces and dashes is saved in the E.164 format.
+
+        Returns:
+            None
+        """
+        form = UserProfileForm(data={**PROFILE_FORM_DATA, "phone_number": "+380 96-123-11-33"},
+                               instance=self.profile)
+        self.assertTrue(form.is_valid())
+        form.save()
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.phone_number, "+380961231133")
+
+    def test_dotted_phone_number_normalized(self) -> None:
+        """
+        Test that a phone number separated with dots is accepted and normalized.
+
+        Returns:
+            None
+        """
+        form = UserProfileForm(data={**PROFILE_FORM_DATA, "phone_number": "+380.96.123.11.22"},
+                               instance=self.profile)
+        self.assertTrue(form.is_valid(), f"Form is invalid. Errors: {form.errors}")
+        self.assertEqual(form.cleaned_data["phone_number"], "+380961231122")
+
     def test_upload_avatar(self) -> None:
         """
         Test that an image can be uploaded as an avatar.
@@ -460,28 +671,60 @@ class UserProfileFormTest(TestCase):
         Returns:
             None
         """
-        image = Image.new('RGB', (100, 100), color='red')
-        image_file = io.BytesIO()
-        image.save(image_file, 'JPEG')
-        image_file.name = 'avatar.jpg'
-        image_file.seek(0)
-        uploaded_file = SimpleUploadedFile("avatar.jpg",
-                                           image_file.getvalue(),
+        uploaded_file = SimpleUploadedFile("avatar.jpg", AVATAR_IMAGE,
                                            content_type="image/jpeg")
 
-        form_data = {
-            "phone_number": "+380961231122",
-            "email": "test@email.com",
-            "location": "New Address"
-        }
-        form = UserProfileForm(data=form_data,
+        form = UserProfileForm(data=PROFILE_FORM_DATA,
                                files={"avatar": uploaded_file},
                                instance=self.profile)
         self.assertTrue(form.is_valid(), f"Form is invalid. "
                                          f"Errors: {form.errors}")
         self.assertEqual(form.cleaned_data['avatar'].name, 'avatar.jpg')
 
+    def test_remove_avatar(self) -> None:
+        """
+        Test that ticking "remove avatar" without an upload removes the avatar.
+
+        This method gives the profile a stored avatar, submits the form with
+        `remove_avatar` set and checks that the avatar field is cleared and
+        the file is deleted from the storage.
+
+        Returns:
+            None
+        """
+        self.profile.avatar.save("avatar.png", ContentFile(AVATAR_IMAGE))
+        avatar_name = self.profile.avatar.name
+
+        form = UserProfileForm(data={**PROFILE_FORM_DATA, "remove_avatar": True},
+                               instance=self.profile)
+        self.assertTrue(form.is_valid(), f"Form is invalid. Errors: {form.errors}")
+        form.save()
+        self.profile.refresh_from_db(fields=['avatar'])
+        self.assertFalse(self.profile.avatar)
+        self.assertFalse(default_storage.exists(avatar_name))
+
+    def test_stored_avatar_not_revalidated(self) -> None:
+        """
+        Test that `validate_avatar_image` only checks new uploads.
+
+        A file already in the storage is accepted without reading its size,
+        even with an extension the validator would reject, while the same
+        file as a new upload is rejected.
+
+        Returns:
+            None
+        """
+        self.profile.avatar.save("avatar.gif", ContentFile(AVATAR_IMAGE))
+        with mock.patch.object(default_storage, "size") as size:
+            validate_avatar_image(self.profile.avatar)
+        size.assert_not_called()
+
+        with self.assertRaises(ValidationError):
+            validate_avatar_image(SimpleUploadedFile("avatar.gif", AVATAR_IMAGE,
+                                                     content_type="image/gif"))
+
 
+@override_settings(STORAGES=IN_MEMORY_STORAGES)
 class EditProfileViewTest(TestCase):
     """
     Test case for testing the `edit_profile` view.
@@ -493,6 +736,8 @@ class EditProfileViewTest(TestCase):
     Attributes:
         user (User): A test user instance to be used for the profile.
         profile (Profile): A test profile instance associated with the user.
+        edit_url (str): The URL of the test user's edit profile page.
+        profile_url (str): The URL of the test user's profile page.
 
     Methods:
         test_get_edit_profile_page:
@@ -505,55 +750,52 @@ class EditProfileViewTest(TestCase):
             Tests that submitting an invalid form does not update the profile.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
-        Set up a test user and log them in.
+        Set up a test user and profile.
 
-        This method disconnects signals for user profile creation
-        and saving, then creates a test user,
-        logs them in, and creates a profile associated with the user.
+        With the signals for user profile creation and saving muted,
+        this method creates a test user and a profile associated
+        with the user once for all tests of the class, and resolves
+        the URLs of the user's edit profile and profile pages.
 
         Returns:
             None
         """
-        post_save.disconnect(create_user_profile, sender=User)
-        post_save.disconnect(save_user_profile, sender=User)
-
-        self.user = User.objects.create_user(username="testuser",
-                                             password="password123")
-        self.client.login(username="testuser", password="password123")
-        self.profile = Profile.objects.create(user=self.user,
-                                              phone_number="+380961231122",
-                                              location="Test Address",
-                                              email="test@email.com")
+        with mute_profile_signals():
+            cls.user = User.objects.create_user(username="view_testuser",
+                                                password="password123")
+            cls.profile = Profile.objects.create(user=cls.user,
+                                                 phone_number="+380961231122",
+                                                 location="Test Address",
+                                                 email="test@email.com")
+        cls.edit_url = reverse("board:edit_profile", kwargs={"user_id": cls.user.id})
+        cls.profile_url = reverse("board:user_profile", kwargs={"user_id": cls.user.id})
 
-    def tearDown(self) -> None:
+    def setUp(self) -> None:
         """
-        Restore the signals after the test.
-
-        This method reconnects the signals for user profile creation
-        and saving after the tests are done.
+        Log the test user in without checking the password.
 
         Returns:
             None
         """
-        post_save.connect(create_user_profile, sender=User)
-        post_save.connect(save_user_profile, sender=User)
+        self.client.force_login(self.user)
 
     def test_get_edit_profile_page(self) -> None:
         """
         Test that the edit profile page loads correctly.
 
         This method sends a GET request to the edit profile page and checks that:
+            - The page is rendered with the expected number of queries.
             - The status code of the response is 200 (OK).
             - The page contains the text "Редагування профілю" (Edit Profile).
 
         Returns:
             None
         """
-        user_id = self.user.id
-        response = self.client.get(reverse("board:edit_profile",
-                                           kwargs={"user_id": user_id}))
+        with self.assertNumQueries(8):
+            response = self.client.get(self.edit_url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Редагування профілю")
 
@@ -563,6 +805,7 @@ class EditProfileViewTest(TestCase):
 
         This method sends a POST request with valid form data
         to the edit profile page and checks that:
+            - The request runs the expected number of queries.
             - The profile is updated with the new values
               for phone number and location.
             - The user is redirected to their user profile page.
@@ -570,19 +813,18 @@ class EditProfileViewTest(TestCase):
         Returns:
             None
         """
-        user_id = self.user.id
-        response = self.client.post(
-            reverse("board:edit_profile", kwargs={"user_id": user_id}),
-            {
-                "phone_number": "+380961231231",
-                "location": "Updated Address"
-            }
-        )
-        self.profile = Profile.objects.get(user=self.user)
+        with self.assertNumQueries(5):
+            response = self.client.post(
+                self.edit_url,
+                {
+                    "phone_number": "+380961231231",
+                    "location": "Updated Address"
+                }
+            )
+        self.profile.refresh_from_db(fields=['phone_number', 'location'])
         self.assertEqual(self.profile.phone_number, "+380961231231")
         self.assertEqual(self.profile.location, "Updated Address")
-        self.assertRedirects(response, reverse("board:user_profile",
-                                               kwargs={"user_id": user_id}))
+        self.assertRedirects(response, self.profile_url)
 
     def test_post_invalid_edit_profile(self) -> None:
         """
@@ -590,19 +832,518 @@ class EditProfileViewTest(TestCase):
 
         This method sends a POST request with invalid form data
         (invalid phone number) and checks that:
+            - The form is re-rendered with the expected number of queries.
             - The profile's phone number is not updated.
             - The page reloads with an error message indicating the form is invalid.
 
         Returns:
             None
         """
-        user_id = self.user.id
-        response = self.client.post(reverse("board:edit_profile",
-                                            kwargs={"user_id": user_id}), {
-                                        "phone_number": "invalid_phone",
-                                        "location": "Updated Address"
-                                    })
-        self.profile = Profile.objects.get(user=self.user)
+        with self.assertNumQueries(8):
+            response = self.client.post(self.edit_url, {
+                "phone_number": "invalid_phone",
+                "location": "Updated Address"
+            })
+        self.profile.refresh_from_db(fields=['phone_number', 'location'])
         self.assertNotEqual(self.profile.phone_number, "invalid_phone")
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Будь ласка, виправте помилки у формі.")
+
+
+class AdStatisticsViewTest(TestCase):
+    """
+    Test case for testing the `ad_statistics` view.
+
+    Attributes:
+        category (Category): A test category holding the active ads.
+        empty_category (Category): A test category without active ads.
+
+    Methods:
+        test_statistics_counts:
+            Tests that the page shows the ad, comment and category counts.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Set up active and inactive ads for the statistics page.
+
+        The ads are created with `make_ads` in one query per batch.
+
+        Returns:
+            None
+        """
+        user = User.objects.create_user(username="statistics_testuser",
+                                        password="password")
+        cls.category = Category.objects.create(name="Транспорт")
+        cls.empty_category = Category.objects.create(name="Послуги")
+        make_ads(3, user, cls.category)
+        make_ads(2, user, cls.empty_category, is_active=False)
+
+    def test_statistics_counts(self) -> None:
+        """
+        Test that the statistics page shows the expected counts.
+
+        This method sends a GET request to the statistics page and checks that:
+            - The page is rendered with the expected number of queries.
+            - The active, inactive and last month ad counts are correct.
+            - Each category is listed with its number of active ads.
+
+        Returns:
+            None
+        """
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("board:ad_statistics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["ads_last_month"], 5)
+        self.assertEqual(response.context["active_ads"], 3)
+        self.assertEqual(response.context["inactive_ads"], 2)
+        self.assertEqual(response.context["comments_count"], 0)
+        self.assertCountEqual(response.context["category_stats"], [
+            {"name": "Транспорт", "num_ads": 3},
+            {"name": "Послуги", "num_ads": 0},
+        ])
+
+
+class RegistrationViewTest(TestCase):
+    """
+    Test case for testing the `register` view with a taken username.
+
+    Attributes:
+        url (str): The URL of the registration page.
+        data (dict): Valid registration data using a taken username.
+
+    Methods:
+        test_taken_username:
+            Tests that a taken username is reported on the username field
+            during validation.
+
+        test_username_taken_during_save:
+            Tests that a username registered after validation is reported
+            on the username field instead of failing the request.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Set up a user whose username is already taken.
+
+        Returns:
+            None
+        """
+        User.objects.create_user(username="taken_testuser", password="password")
+        cls.url = reverse("board:register")
+        cls.data = {"username": "taken_testuser",
+                    "email": "taken@email.com",
+                    "password1": "password123",
+                    "password2": "password123"}
+
+    def test_taken_username(self) -> None:
+        """
+        Test that a taken username fails the form validation.
+
+        Returns:
+            None
+        """
+        response = self.client.post(self.url, self.data)
+        self.assertEqual(response.status_code, 200)
+        self.assertFormError(response.context["form"], "username",
+                             "Користувач із таким ім'ям вже існує.")
+        self.assertEqual(User.objects.filter(username="taken_testuser").count(), 1)
+
+    def test_username_taken_during_save(self) -> None:
+        """
+        Test that the unique constraint is reported on the username field.
+
+        The validation check is bypassed, as if another request registered
+        the same username between validation and saving.
+
+        Returns:
+            None
+        """
+        with mock.patch.object(RegistrationForm, "clean_username",
+                               lambda form: form.cleaned_data["username"]):
+            response = self.client.post(self.url, self.data)
+        self.assertEqual(response.status_code, 200)
+        self.assertFormError(response.context["form"], "username",
+                             "Користувач із таким ім'ям вже існує.")
+
+
+class UploadSizeLimitMiddlewareTest(TestCase):
+    """
+    Test case for testing the `UploadSizeLimitMiddleware`.
+
+    Attributes:
+        middleware (UploadSizeLimitMiddleware): The middleware under test.
+        factory (RequestFactory): Builds the requests passed to the middleware.
+
+    Methods:
+        test_oversized_upload_rejected:
+            Tests that an oversized upload to the registration page gets a 413 response.
+
+        test_upload_under_limit_passes:
+            Tests that an upload under the limit reaches the view.
+
+        test_non_multipart_request_passes:
+            Tests that a large request that is not multipart reaches the view.
+
+        test_unmarked_view_passes:
+            Tests that views not marked with `limit_upload_size` are not checked.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Set up the middleware and the request factory.
+
+        Returns:
+            None
+        """
+        cls.middleware = UploadSizeLimitMiddleware(lambda request: HttpResponse())
+        cls.factory = RequestFactory()
+
+    def post(self, content_type: str, content_length: int) -> HttpRequest:
+        """
+        Builds a POST request that declares the given body size.
+
+        Args:
+            content_type: The content type of the request.
+            content_length: The declared body size, in bytes.
+
+        Returns:
+            The request.
+        """
+        return self.factory.post("/", data=b"--x--", content_type=content_type,
+                                 CONTENT_LENGTH=str(content_length))
+
+    def test_oversized_upload_rejected(self) -> None:
+        """
+        Test that an oversized multipart upload is refused before it is read.
+
+        Returns:
+            None
+        """
+        response = self.client.post(reverse("board:register"), data=b"--x--",
+                                    content_type="multipart/form-data; boundary=x",
+                                    CONTENT_LENGTH=str(UPLOAD_REQUEST_MAX_SIZE + 1))
+        self.assertEqual(response.status_code, 413)
+
+    def test_upload_under_limit_passes(self) -> None:
+        """
+        Test that a multipart upload under the limit is passed to the view.
+
+        Returns:
+            None
+        """
+        request = self.post("multipart/form-data; boundary=x", UPLOAD_REQUEST_MAX_SIZE)
+        self.assertIsNone(self.middleware.process_view(
+            request, limit_upload_size(lambda request: None), (), {}))
+
+    def test_non_multipart_request_passes(self) -> None:
+        """
+        Test that a request that is not multipart is not checked.
+
+        Returns:
+            None
+        """
+        request = self.post("application/json", UPLOAD_REQUEST_MAX_SIZE + 1)
+        self.assertIsNone(self.middleware.process_view(
+            request, limit_upload_size(lambda request: None), (), {}))
+
+    def test_unmarked_view_passes(self) -> None:
+        """
+        Test that an oversized upload to a view without the mark is not checked.
+
+        Returns:
+            None
+        """
+        request = self.post("multipart/form-data; boundary=x", UPLOAD_REQUEST_MAX_SIZE + 1)
+        self.assertIsNone(self.middleware.process_view(
+            request, lambda request: None, (), {}))
+
+
+class AdminStatisticsDataTest(TestCase):
+    """
+    Test case for testing the admin statistics JSON endpoint.
+
+    Attributes:
+        admin (User): A superuser allowed to open the admin site.
+        user (User): The author of the test ads.
+        category (Category): The category of the test ads.
+        url (str): The URL of the statistics data endpoint.
+
+    Methods:
+        test_statistics_data:
+            Tests that the endpoint returns the statistics and caches them.
+
+        test_statistics_invalidated_on_ad_save:
+            Tests that saving an ad drops the cached statistics.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Set up a superuser and two active ads.
+
+        Returns:
+            None
+        """
+        cls.admin = User.objects.create_superuser(username="admin_testuser",
+                                                  password="password")
+        cls.user = User.objects.create_user(username="stats_author_testuser",
+                                            password="password")
+        cls.category = Category.objects.create(name="Книги")
+        make_ads(2, cls.user, cls.category)
+        cls.url = reverse("admin:statistics_data")
+
+    def setUp(self) -> None:
+        """
+        Log the superuser in and drop the cached statistics around each test.
+
+        Returns:
+            None
+        """
+        cache.delete(STATISTICS_CACHE_KEY)
+        self.addCleanup(cache.delete, STATISTICS_CACHE_KEY)
+        self.client.force_login(self.admin)
+
+    def test_statistics_data(self) -> None:
+        """
+        Test that the endpoint returns the statistics as JSON.
+
+        The second request is served from the cache, so it only
+        loads the session and the user.
+
+        Returns:
+            None
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["active_ads"], 2)
+        self.assertEqual(data["inactive_ads"], 0)
+        self.assertEqual(data["category_stats"], [{"name": "Книги", "num_ads": 2}])
+
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(self.url).json(), data)
+
+    def test_statistics_invalidated_on_ad_save(self) -> None:
+        """
+        Test that a new ad is counted after the cached statistics are dropped.
+
+        Returns:
+            None
+        """
+        self.assertEqual(self.client.get(self.url).json()["active_ads"], 2)
+        Ad.objects.create(title="Продам книгу", description="Нова", price=300,
+                          category=self.category, user=self.user)
+        self.assertEqual(self.client.get(self.url).json()["active_ads"], 3)
+
+
+@override_settings(STORAGES=IN_MEMORY_STORAGES)
+class AvatarProcessorTest(TestCase):
+    """
+    Test case for testing the avatar URL cached in the session by `avatar_processor`.
+
+    Attributes:
+        user (User): A test user instance.
+        profile (Profile): A test profile instance associated with the user.
+        url (str): The URL of a page rendered with the avatar URL.
+
+    Methods:
+        test_avatar_url_cached_in_session:
+            Tests that the avatar URL is stored in the session and reused.
+
+        test_avatar_url_reset_on_login:
+            Tests that logging in drops the cached avatar URL.
+
+        test_avatar_url_changes_after_update:
+            Tests that a new avatar is shown after the profile is updated.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Set up a test user and profile.
+
+        Returns:
+            None
+        """
+        with mute_profile_signals():
+            cls.user = User.objects.create_user(username="avatar_testuser",
+                                                password="password")
+            cls.profile = Profile.objects.create(user=cls.user)
+        cls.url = reverse("board:ad_list")
+
+    def setUp(self) -> None:
+        """
+        Log the test user in without checking the password.
+
+        Returns:
+            None
+        """
+        self.client.force_login(self.user)
+
+    def test_avatar_url_cached_in_session(self) -> None:
+        """
+        Test that the second request takes the avatar URL from the session.
+
+        The first request loads the profile avatar and saves the session;
+        the second one only loads the session, the user and the ads.
+
+        Returns:
+            None
+        """
+        with self.assertNumQueries(7):
+            first = self.client.get(self.url)
+        self.assertEqual(self.client.session[AVATAR_URL_SESSION_KEY], first.context["avatar_url"])
+
+        with self.assertNumQueries(3):
+            second = self.client.get(self.url)
+        self.assertEqual(second.context["avatar_url"], first.context["avatar_url"])
+
+    def test_avatar_url_reset_on_login(self) -> None:
+        """
+        Test that the `user_logged_in` signal drops the cached avatar URL.
+
+        Returns:
+            None
+        """
+        self.client.get(self.url)
+        self.assertIn(AVATAR_URL_SESSION_KEY, self.client.session)
+        self.client.force_login(self.user)
+        self.assertNotIn(AVATAR_URL_SESSION_KEY, self.client.session)
+
+    def test_avatar_url_changes_after_update(self) -> None:
+        """
+        Test that the avatar URL is resolved again after the profile is edited.
+
+        Returns:
+            None
+        """
+        old_url = self.client.get(self.url).context["avatar_url"]
+        self.client.post(reverse("board:edit_profile", kwargs={"user_id": self.user.id}),
+                         {"avatar": SimpleUploadedFile("avatar.png", AVATAR_IMAGE,
+                                                       content_type="image/png")})
+        self.assertNotIn(AVATAR_URL_SESSION_KEY, self.client.session)
+
+        new_url = self.client.get(self.url).context["avatar_url"]
+        self.assertNotEqual(new_url, old_url)
+        self.profile.refresh_from_db(fields=['avatar'])
+        self.assertEqual(new_url, self.profile.avatar.url)
+
+
+class PasswordChangeFormTest(TestCase):
+    """
+    Test case for testing the order of checks in the `PasswordChangeForm`.
+
+    Attributes:
+        user (User): A test user whose password is changed.
+
+    Methods:
+        test_wrong_old_password:
+            Tests that a wrong current password is reported on `old_password`.
+
+        test_mismatched_new_password_skips_old_password_check:
+            Tests that the current password is not hashed when the new
+            passwords do not match.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Set up a test user with a known password.
+
+        Returns:
+            None
+        """
+        cls.user = User.objects.create_user(username="password_testuser",
+                                            password="password123")
+
+    def test_wrong_old_password(self) -> None:
+        """
+        Test that a wrong current password fails once the new password is valid.
+
+        Returns:
+            None
+        """
+        form = PasswordChangeForm(user=self.user, data={
+            "old_password": "wrong-password",
+            "new_password1": "Zx9!newPassw0rd",
+            "new_password2": "Zx9!newPassw0rd",
+        })
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors["old_password"], ["Невірний поточний пароль."])
+
+    def test_mismatched_new_password_skips_old_password_check(self) -> None:
+        """
+        Test that mismatched new passwords are reported without checking
+        the current password.
+
+        Returns:
+            None
+        """
+        form = PasswordChangeForm(user=self.user, data={
+            "old_password": "password123",
+            "new_password1": "Zx9!newPassw0rd",
+            "new_password2": "Zx9!otherPassw0rd",
+        })
+        with mock.patch("board.forms.check_password") as check_password:
+            self.assertFalse(form.is_valid())
+        check_password.assert_not_called()
+        self.assertIn("new_password2", form.errors)
+
+
+class ProfileDeleteSignalsTest(TestCase):
+    """
+    Test case for testing the `delete_user_profile` signal handler.
+
+    Attributes:
+        user (User): A test user instance.
+        profile (Profile): A test profile instance associated with the user.
+
+    Methods:
+        test_delete_user:
+            Tests that deleting a user removes the profile without
+            deleting the user a second time.
+
+        test_delete_profile:
+            Tests that deleting a profile directly removes its user.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Set up a test user and profile.
+
+        Returns:
+            None
+        """
+        with mute_profile_signals():
+            cls.user = User.objects.create_user(username="delete_testuser",
+                                                password="password")
+            cls.profile = Profile.objects.create(user=cls.user)
+
+    def test_delete_user(self) -> None:
+        """
+        Test that the cascade from a user deletion does not delete the user again.
+
+        Returns:
+            None
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.user.delete()
+        user_deletes = [query for query in queries.captured_queries
+                        if query["sql"].startswith('DELETE FROM "auth_user"')]
+        self.assertEqual(len(user_deletes), 1)
+        self.assertFalse(Profile.objects.filter(pk=self.profile.pk).exists())
+
+    def test_delete_profile(self) -> None:
+        """
+        Test that deleting a profile directly deletes its user.
+
+        Returns:
+            None
+        """
+        self.profile.delete()
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
@@ -12,26 +12,49 @@ Key Functions:
 - **validate_phone_number**: Validates phone numbers, ensuring they are in a valid
   format and are valid for the specified country.
 
+- **normalize_phone_number**: Validates a phone number and converts it to the canonical
+  E.164 format.
+
 Dependencies:
 - os
+- re
 - phonenumbers
 - django.core.exceptions
 - django.utils.translation
 - django.core.files.uploadedfile
+
+Constants:
+    - AVATAR_EXTENSIONS (frozenset): File extensions accepted for avatar images.
+    - AVATAR_IMAGE_MAX_SIZE (int): Maximum avatar file size, in bytes.
+    - PHONE_NUMBER_SHAPE (Pattern): Rough shape of a phone number, checked before
+      any phone number is parsed by `phonenumbers`.
+    - PHONE_NUMBER_FORMAT_MESSAGE (str): Error message for a badly formatted phone number.
 """
 
 import os
+import re
 import phonenumbers
 from phonenumbers.phonenumberutil import NumberParseException
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from django.core.files.uploadedfile import InMemoryUploadedFile
 
+AVATAR_EXTENSIONS = frozenset(('png', 'jpg', 'jpeg'))
+AVATAR_IMAGE_MAX_SIZE = 3 * 1024 * 1024
+PHONE_NUMBER_SHAPE = re.compile(r'^\+?\d[\d\s().\-]{5,20}$')
+PHONE_NUMBER_FORMAT_MESSAGE = _("The phone number is not in a valid format. "
+                                "Please make sure it includes the country code "
+                                "and the correct number of digits"
+                                "(like '+380961231122').")
+
 
 def validate_avatar_image(file: InMemoryUploadedFile):
     """
     Custom validator to check file type and size for avatar.
     Only allows png, jpg, jpeg file types, and a maximum size of 3 MB.
+    Files that are already saved to the storage were checked when uploaded
+    and are skipped, so validating a profile does not query the storage.
+    The size is checked first, since it needs no work on the file name.
 
     Args:
         file: The uploaded image file.
@@ -39,15 +62,62 @@ def validate_avatar_image(file: InMemoryUploadedFile):
     Raises:
         ValidationError: If the file type is invalid or the file size exceeds 3 MB.
     """
-    ext = os.path.splitext(file.name)[1].lower()[1:]
-    valid_extensions = ['png', 'jpg', 'jpeg']
-    if ext not in valid_extensions:
-        raise ValidationError(_('Only files with extensions: png, jpg, jpeg.'))
+    if getattr(file, '_committed', False):
+        return
 
-    max_size_mb = 3 * 1024 * 1024
-    if file.size > max_size_mb:
+    if file.size > AVATAR_IMAGE_MAX_SIZE:
         raise ValidationError(_('File size cannot exceed 3 MB.'))
 
+    ext = os.path.splitext(file.name)[1][1:].lower()
+    if ext not in AVATAR_EXTENSIONS:
+        raise ValidationError(_('Only files with extensions: png, jpg, jpeg.'))
+
+
+def _parse_phone_number(value: str) -> phonenumbers.PhoneNumber:
+    """
+    Parses a phone number that has the shape of one.
+
+    Values that do not match `PHONE_NUMBER_SHAPE` are rejected before
+    `phonenumbers` parses them.
+
+    Args:
+        value: The phone number string to parse.
+
+    Returns:
+        The parsed phone number.
+
+    Raises:
+        ValidationError: If the phone number is not in a valid format.
+    """
+    if not PHONE_NUMBER_SHAPE.match(value):
+        raise ValidationError(PHONE_NUMBER_FORMAT_MESSAGE)
+    try:
+        return phonenumbers.parse(value, None)
+    except NumberParseException as exc:
+        raise ValidationError(PHONE_NUMBER_FORMAT_MESSAGE) from exc
+
+
+def _validated_phone_number(value: str) -> phonenumbers.PhoneNumber:
+    """
+    Parses a phone number and checks that it is valid for its country.
+
+    Args:
+        value: The phone number string to validate.
+
+    Returns:
+        The parsed phone number.
+
+    Raises:
+        ValidationError: If the phone number is invalid or not in a valid format.
+    """
+    phone_number = _parse_phone_number(value)
+    if not phonenumbers.is_valid_number(phone_number):
+        raise ValidationError(_("The phone number is invalid. "
+                                "Please make sure it follows the correct format "
+                                "and is valid for the country."
+                                "(like '+380961231122')."))
+    return phone_number
+
 
 def validate_phone_number(value: str):
     """
@@ -60,15 +130,27 @@ def validate_phone_number(value: str):
     Raises:
         ValidationError: If the phone number is invalid or not in a valid format.
     """
-    try:
-        phone_number = phonenumbers.parse(value, None)
-        if not phonenumbers.is_valid_number(phone_number):
-            raise ValidationError(_("The phone number is invalid. "
-                                    "Please make sure it follows the correct format "
-                                    "and is valid for the country."
-                                    "(like '+380961231122')."))
-    except NumberParseException as exc:
-        raise ValidationError(_("The phone number is not in a valid format. "
-                                "Please make sure it includes the country code "
-                                "and the correct number of digits"
-                                "(like '+380961231122').")) from exc
+    _validated_phone_number(value)
+
+
+def normalize_phone_number(value: str) -> str:
+    """
+    Validates a phone number and converts it to the E.164 format
+    (like '+380961231122'), so the same number is always stored as the same string.
+
+    Invalid numbers are reported here, so the model validator only runs
+    on numbers that were already accepted.
+
+    Args:
+        value: The phone number string entered by the user.
+
+    Returns:
+        The phone number in the E.164 format, or the original value if it is empty.
+
+    Raises:
+        ValidationError: If the phone number is invalid or not in a valid format.
+    """
+    if not value:
+        return value
+    phone_number = _validated_phone_number(value)
+    return phonenumbers.format_number(phone_number, phonenumbers.PhoneNumberFormat.E164)
@@ -37,18 +37,21 @@ Dependencies:
 - django.contrib.messages
 - django.contrib.auth
 - django.http
+- django.core.exceptions
 - django.urls
 - django.utils
 - datetime
 - django.db.models
 - .models
 - .forms
+- .middleware
 """
 from typing import Any
 from datetime import timedelta
 
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.http import HttpResponse, HttpRequest, Http404, HttpResponseBase
+from django.core.exceptions import ValidationError
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.views import LoginView, LogoutView
@@ -56,13 +59,16 @@ from django.contrib.auth import login, logout, update_session_auth_hash
 from django.contrib import messages
 from django.urls import reverse_lazy
 from django.utils import timezone
-from django.db.models import Count
+from django.db.models import Count, F, Q
 
+from .constants import AVATAR_URL_SESSION_KEY
+from .middleware import limit_upload_size
 from .models import Ad, User, Category, Comment, Profile
 from .forms import CommentForm, RegistrationForm, UserProfileForm, PasswordChangeForm, AdForm
 from celery_tasks.tasks import send_registration_email, send_advertisement_email
 
 
+@limit_upload_size
 def register_view(request: HttpRequest) -> HttpResponse:
     """
     Handles user registration.
@@ -81,7 +87,11 @@ def register_view(request: HttpRequest) -> HttpResponse:
     if request.method == 'POST':
         form = RegistrationForm(request.POST, request.FILES)
         if form.is_valid():
-            user = form.save()
+            try:
+                user = form.save()
+            except ValidationError as error:
+                form.add_error('username', error)
+                return render(request, 'registration/register.html', {'form': form})
 
             refresh = RefreshToken.for_user(user)
             access_token = str(refresh.access_token)
@@ -113,6 +123,7 @@ def ad_list(request: HttpRequest) -> HttpResponse:
     Displays the list of active advertisements.
 
     Fetches all active advertisements and renders them in the ad list page.
+    Only the columns shown in the list are loaded.
 
     Args:
         request: The HTTP request object.
@@ -120,7 +131,7 @@ def ad_list(request: HttpRequest) -> HttpResponse:
     Returns:
         The rendered ad list page with the active ads.
     """
-    ads = Ad.objects.filter(is_active=True)
+    ads = Ad.objects.filter(is_active=True).only('title', 'price')
     return render(request, 'board/ad_list.html', {'ads': ads})
 
 
@@ -138,7 +149,8 @@ def ad_detail(request: HttpRequest, ad_id: int) -> HttpResponse:
         The rendered ad detail page with the ad's information and comments.
     """
     ad = get_object_or_404(Ad, id=ad_id)
-    comments = ad.comments.all()
+    comments = (ad.comments.select_related('user').only('content', 'ad', 'user__username')
+                .order_by('created_at'))
     form = CommentForm(request.POST or None)
     if form.is_valid():
         comment = form.save(commit=False)
@@ -168,11 +180,13 @@ def user_profile(request: HttpRequest, user_id: int) -> HttpResponse:
         return redirect('board:ad_list')
 
     profile = get_object_or_404(Profile, user=user)
+    ads = user.ad_set.only('title', 'price', 'user')
 
     return render(request, 'board/profile.html',
-                  {'user': user, 'profile': profile})
+                  {'user': user, 'profile': profile, 'ads': ads})
 
 
+@limit_upload_size
 @login_required
 def edit_profile_view(request: HttpRequest, user_id: int) -> HttpResponse:
     """
@@ -195,6 +209,7 @@ def edit_profile_view(request: HttpRequest, user_id: int) -> HttpResponse:
         form = UserProfileForm(request.POST, request.FILES, instance=_user_profile)
         if form.is_valid():
             form.save()
+            request.session.pop(AVATAR_URL_SESSION_KEY, None)
             messages.success(request, "Профіль успішно оновлено!")
             return redirect('board:user_profile', user_id=user.id)
         for field, errors in form.errors.items():
@@ -312,16 +327,17 @@ def ad_statistics(request: HttpRequest) -> HttpResponse:
         The rendered statistics page with the ad statistics and category stats.
     """
     last_month = timezone.now() - timedelta(days=30)
-    ads_last_month = Ad.objects.filter(created_at__gte=last_month).count()
-    active_ads = Ad.objects.filter(is_active=True).count()
-    inactive_ads = Ad.objects.filter(is_active=False).count()
+    ad_stats = Ad.objects.aggregate(
+        ads_last_month=Count('pk', filter=Q(created_at__gte=last_month)),
+        active_ads=Count('pk', filter=Q(is_active=True)),
+        inactive_ads=Count('pk', filter=Q(is_active=False)),
+    )
     comments_count = Comment.objects.count()
-    category_stats = Category.objects.annotate(num_ads=Count('ad')).values('name', 'num_ads')
+    category_stats = Category.objects.with_active_counts().values(
+        'name', num_ads=F('_active_ads_count'))
 
     return render(request, 'board/statistics.html', {
-        'ads_last_month': ads_last_month,
-        'active_ads': active_ads,
-        'inactive_ads': inactive_ads,
+        **ad_stats,
         'category_stats': category_stats,
         'comments_count': comments_count
     })
@@ -370,11 +386,9 @@ def add_ad(request: HttpRequest, user_id: int) -> HttpResponse:
         if form.is_valid():
             ad = form.save(commit=False)
             ad.user = request.user
-            category = form.cleaned_data.get('category')
-            if not category:
+            if not ad.category_id:
                 messages.error(request, "Категорія не була вибрана або створена.")
                 return render(request, 'board/add_ad.html', {'form': form, 'user_id': user_id})
-            ad.category = category
             ad.save()
             messages.success(request, "Оголошення успішно додано!")
             return redirect('board:user_profile', user_id=user.id)
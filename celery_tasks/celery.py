@@ -18,4 +18,8 @@ app.conf.beat_schedule = {
         'task': 'celery_tasks.tasks.log_total_users',
         'schedule': crontab(minute='*/10'),
     },
+    'deactivate-expired-ads-every-hour': {
+        'task': 'celery_tasks.tasks.deactivate_expired_ads',
+        'schedule': crontab(minute=0),
+    },
 }
@@ -1,8 +1,12 @@
 from celery import shared_task
 from django.core.mail import send_mail
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 import logging
 
+from board.constants import STATISTICS_CACHE_KEY
+from board.models import Ad
+
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
@@ -30,7 +34,29 @@ def send_advertisement_email(user_id):
     logger.info(f'Рекламний email надіслано користувачу: {user.email}')
 
 
+@shared_task
+def send_ad_created_email(title, email):
+    send_mail(
+        'Нове оголошення',
+        f'Ви створили нове оголошення: {title}',
+        'burkalo@gmail.com',
+        [email],
+        fail_silently=False,
+    )
+    logger.info(f'Email про нове оголошення надіслано користувачу: {email}')
+
+
 @shared_task
 def log_total_users():
     total = User.objects.count()
     logger.info(f'Кількість користувачів у системі: {total}')
+
+
+@shared_task
+def deactivate_expired_ads():
+    deactivated = Ad.deactivate_expired()
+    # update() sends no signals, so the statistics cached in the shared CACHES
+    # backend are dropped here for the web workers as well.
+    if deactivated:
+        cache.delete(STATISTICS_CACHE_KEY)
+    logger.info(f'Деактивовано прострочених оголошень: {deactivated}')
@@ -80,6 +80,7 @@ REST_FRAMEWORK = {
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'board.middleware.UploadSizeLimitMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
@@ -234,6 +235,17 @@ CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "rpc://")
 
 CHAT_BROKER_URL = os.getenv("CHAT_BROKER_URL", "redis://redis:6379/1")
 
+CACHE_URL = os.getenv("CACHE_URL", "redis://redis:6379/2")
+
+# The cache is shared by the web workers and the Celery worker, so a cache.delete()
+# in one process invalidates the cached statistics and category choices for all of them.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': CACHE_URL,
+    }
+}
+
 ASGI_APPLICATION = 'my_site.asgi.application'
 
 CHANNEL_LAYERS = {
@@ -0,0 +1,28 @@
+"""
+Django test settings for my_site project.
+
+Extends the main settings with an in-memory SQLite database, a fast
+password hasher and a local memory cache, so the test suite needs no
+PostgreSQL or Redis server and creating test users does not run PBKDF2.
+
+Usage:
+    python manage.py test --settings=my_site.settings_test
+"""
+from .settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        # The schema is created from the models, without replaying migrations.
+        'TEST': {'MIGRATE': False},
+    }
+}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}